@@ -47,4 +47,54 @@ export interface RoundJsonResponse {
     end_time: string;
     duration_seconds: number;
   }[];
-}
\ No newline at end of file
+}
+
+export interface ChartSeries {
+  x: number[];
+  y: number[];
+}
+
+export interface ChartSeriesJsonResponse {
+  total_rounds: number;
+  target_points: number;
+  bucket_seconds: number;
+  round_bucket_seconds: number;
+  players: string[];
+  cumulative_kills: { [player: string]: ChartSeries };
+  cumulative_damage: { [player: string]: ChartSeries };
+  round_damage_buckets: number[][];
+  damage_timeline: ChartSeries;
+  score_progression: { [team: string]: ChartSeries };
+}
+
+export interface RoundImpactJsonResponse {
+  total_rounds: number;
+  player_stats: {
+    [player: string]: {
+      rounds_played: number;
+      total_damage: number;
+      kills: number;
+      assists: number;
+      deaths: number;
+      kast_rounds: number;
+      trade_kills: number;
+      times_traded: number;
+      adr: number;
+      kast_percentage: number;
+    };
+  };
+  round_stats: {
+    round_number: number;
+    players: {
+      [player: string]: {
+        damage: number;
+        kills: number;
+        assists: number;
+        died: boolean;
+        survived: boolean;
+        traded: boolean;
+        kast: boolean;
+      };
+    };
+  }[];
+}
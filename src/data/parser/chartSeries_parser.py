@@ -0,0 +1,254 @@
+import re
+import json
+import os
+import math
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+
+def lttb(xs: List[float], ys: List[float], threshold: int) -> Tuple[List[float], List[float]]:
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, for every bucket in between, the point
+    forming the largest triangle with its neighbours, so peaks survive.
+    """
+    length = len(xs)
+    if threshold >= length or threshold < 3:
+        return list(xs), list(ys)
+
+    sampled_x = [xs[0]]
+    sampled_y = [ys[0]]
+    bucket_size = (length - 2) / (threshold - 2)
+    previous = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int(math.floor((i + 1) * bucket_size)) + 1
+        next_end = min(int(math.floor((i + 2) * bucket_size)) + 1, length)
+        next_count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / next_count
+        avg_y = sum(ys[next_start:next_end]) / next_count
+
+        start = int(math.floor(i * bucket_size)) + 1
+        end = int(math.floor((i + 1) * bucket_size)) + 1
+        best_area = -1
+        best_index = start
+        for j in range(start, end):
+            area = abs((xs[previous] - avg_x) * (ys[j] - ys[previous])
+                       - (xs[previous] - xs[j]) * (avg_y - ys[previous]))
+            if area > best_area:
+                best_area = area
+                best_index = j
+
+        sampled_x.append(xs[best_index])
+        sampled_y.append(ys[best_index])
+        previous = best_index
+
+    sampled_x.append(xs[-1])
+    sampled_y.append(ys[-1])
+    return sampled_x, sampled_y
+
+
+class ChartSeriesParser:
+    def __init__(self, target_points: int = 60, bucket_seconds: int = 5):
+        self.target_points = target_points
+        self.bucket_seconds = bucket_seconds
+        self.timestamp_pattern = r'^(\d{2}/\d{2}/\d{4} - \d{2}:\d{2}:\d{2})'
+        self.kill_pattern = r'"([^"]+)<\d+><STEAM_\d:\d:\d+><([^>]+)>" \[([-\d\s]+)\] killed "([^"]+)<\d+><STEAM_\d:\d:\d+><([^>]+)>" \[([-\d\s]+)\] with "([^"]+)"(\s*\(headshot\))?'
+        self.damage_pattern = r'"(.+?)<(\d+)>.+?" \[.+?\] attacked "(.+?)<(\d+)>.+?" \[.+?\] with "([^"]+)" \(damage "(\d+)"\).+?\(hitgroup "([^"]+)"\)'
+        self.team_score_pattern = r'Team "(CT|TERRORIST)" scored "(\d+)" with "(\d+)" players'
+        self.team_playing_pattern = r'MatchStatus: Team playing "(CT|TERRORIST)": (.+)'
+        self.status_score_pattern = r'MatchStatus: Score: (\d+):(\d+) on map "([^"]+)" RoundsPlayed: (-?\d+)'
+        self.live_pattern = r'\[FACEIT\^\] LIVE!'
+
+    def parse_timestamp(self, timestamp_str: str) -> datetime:
+        return datetime.strptime(timestamp_str, '%m/%d/%Y - %H:%M:%S')
+
+    def series(self, xs: List[float], ys: List[float]) -> Dict[str, List[float]]:
+        sampled_x, sampled_y = lttb(xs, ys, self.target_points)
+        return {"x": sampled_x, "y": sampled_y}
+
+    def cumulative_series(self, per_round: Dict[str, Dict[int, int]], players: List[str],
+                          total_rounds: int) -> Dict[str, Dict[str, List[float]]]:
+        """Turn sparse per-round counts into downsampled running totals per player.
+
+        Round 0 holds events between LIVE! and the first Round_Start, as in kill_stats.json.
+        """
+        rounds = list(range(0, total_rounds + 1))
+        result = {}
+        for player in players:
+            counts = per_round.get(player, {})
+            running = 0
+            totals = []
+            for round_number in rounds:
+                running += counts.get(round_number, 0)
+                totals.append(running)
+            result[player] = self.series(rounds, totals)
+        return result
+
+    def parse_chart_series(self, log_content: str) -> Dict:
+        lines = log_content.strip().split('\n')
+
+        # Initialize tracking variables
+        live_started = False
+        live_start_time = None
+        current_round = 0
+        round_start_time = None
+        players = []
+        kills_by_round = {}
+        damage_by_round = {}
+        round_buckets = []
+        timeline = {}
+        score = {"CT": 0, "T": 0}
+        teams = {"CT": "", "T": ""}
+        score_progression = {}
+
+        for line in lines:
+            timestamp_match = re.match(self.timestamp_pattern, line)
+            if not timestamp_match:
+                continue
+
+            content = line[timestamp_match.end():].strip(': ')
+
+            # Score and team tracking follow MatchStatusParser
+            team_score_match = re.match(self.team_score_pattern, content)
+            if team_score_match:
+                score["CT" if team_score_match.group(1) == "CT" else "T"] = int(team_score_match.group(2))
+                continue
+            team_playing_match = re.match(self.team_playing_pattern, content)
+            if team_playing_match:
+                teams["CT" if team_playing_match.group(1) == "CT" else "T"] = team_playing_match.group(2)
+                continue
+            status_match = re.match(self.status_score_pattern, content)
+            if status_match:
+                score["CT"] = int(status_match.group(1))
+                score["T"] = int(status_match.group(2))
+                continue
+
+            # Round and event tracking follow EnhancedKillParser
+            if not live_started:
+                if re.search(self.live_pattern, content):
+                    live_started = True
+                    live_start_time = self.parse_timestamp(timestamp_match.group(1))
+                continue
+
+            if 'World triggered "Round_Start"' in content:
+                current_round += 1
+                round_start_time = self.parse_timestamp(timestamp_match.group(1))
+                round_buckets.append({})
+                continue
+
+            if 'World triggered "Round_End"' in content:
+                for side in ("CT", "T"):
+                    name = teams[side] or side
+                    score_progression.setdefault(name, {})[current_round] = score[side]
+                continue
+
+            round_number = current_round
+
+            kill_match = re.search(self.kill_pattern, content)
+            if kill_match:
+                killer = kill_match.group(1)
+                for player in (killer, kill_match.group(4)):
+                    if player not in players:
+                        players.append(player)
+                kills = kills_by_round.setdefault(killer, {})
+                kills[round_number] = kills.get(round_number, 0) + 1
+                continue
+
+            damage_match = re.search(self.damage_pattern, content)
+            if not damage_match:
+                continue
+
+            attacker = damage_match.group(1)
+            damage = int(damage_match.group(6))
+            if attacker not in players:
+                players.append(attacker)
+            damage_totals = damage_by_round.setdefault(attacker, {})
+            damage_totals[round_number] = damage_totals.get(round_number, 0) + damage
+
+            timestamp = self.parse_timestamp(timestamp_match.group(1))
+            match_bucket = int((timestamp - live_start_time).total_seconds()) // self.bucket_seconds
+            timeline[match_bucket] = timeline.get(match_bucket, 0) + damage
+            if round_start_time is not None:
+                round_bucket = int((timestamp - round_start_time).total_seconds()) // self.bucket_seconds
+                buckets = round_buckets[-1]
+                buckets[round_bucket] = buckets.get(round_bucket, 0) + damage
+
+        total_rounds = current_round
+
+        # Pad every round to the same bucket count so rounds stack in one chart,
+        # merging neighbouring buckets so a round never exceeds target_points
+        bucket_count = max((max(b) + 1 for b in round_buckets if b), default=0)
+        merge = max(1, math.ceil(bucket_count / self.target_points))
+        merged_count = math.ceil(bucket_count / merge)
+        round_damage_buckets = []
+        for buckets in round_buckets:
+            merged = [0] * merged_count
+            for bucket, damage in buckets.items():
+                merged[bucket // merge] += damage
+            round_damage_buckets.append(merged)
+
+        timeline_length = max(timeline) + 1 if timeline else 0
+        timeline_x = [i * self.bucket_seconds for i in range(timeline_length)]
+        timeline_y = [timeline.get(i, 0) for i in range(timeline_length)]
+
+        score_series = {}
+        for name, scores in score_progression.items():
+            rounds = sorted(scores)
+            score_series[name] = self.series(rounds, [scores[r] for r in rounds])
+
+        return {
+            "total_rounds": total_rounds,
+            "target_points": self.target_points,
+            "bucket_seconds": self.bucket_seconds,
+            "round_bucket_seconds": self.bucket_seconds * merge,
+            "players": players,
+            "cumulative_kills": self.cumulative_series(kills_by_round, players, total_rounds),
+            "cumulative_damage": self.cumulative_series(damage_by_round, players, total_rounds),
+            "round_damage_buckets": round_damage_buckets,
+            "damage_timeline": self.series(timeline_x, timeline_y),
+            "score_progression": score_series
+        }
+
+
+def main():
+    parser = ChartSeriesParser()
+
+    # Get the directory of the script
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Construct paths relative to the script location
+    input_path = os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
+    output_path = os.path.join(script_dir, '../../../public/data/chart_series.json')
+
+    try:
+        # Read input file
+        with open(input_path, 'r', encoding='utf-8') as file:
+            log_content = file.read()
+
+        # Parse the log
+        chart_data = parser.parse_chart_series(log_content)
+
+        # Write to JSON file
+        with open(output_path, 'w', encoding='utf-8') as file:
+            json.dump(chart_data, file, indent=2)
+
+        # Print summary
+        print("\nChart Series Summary:")
+        print(f"Total Rounds: {chart_data['total_rounds']}")
+        print(f"Players: {len(chart_data['players'])}")
+        print(f"Damage Timeline Points: {len(chart_data['damage_timeline']['x'])}")
+        print(f"Round Damage Buckets: {len(chart_data['round_damage_buckets'])} x "
+              f"{chart_data['round_bucket_seconds']}s")
+        for team, series in chart_data['score_progression'].items():
+            print(f"{team}: {series['y'][-1] if series['y'] else 0}")
+
+    except FileNotFoundError:
+        print(f"Error: Could not find input file at {input_path}")
+    except Exception as e:
+        print(f"Error: An unexpected error occurred: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
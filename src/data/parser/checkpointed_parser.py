@@ -0,0 +1,242 @@
+import sys
+import json
+import os
+import hashlib
+import tempfile
+from typing import Dict, List, Optional
+
+from kills_parser import EnhancedKillParser
+from playerAccuracy_parser import PlayerAccuracyParser
+from weapondDamage_parser import WeaponDamageParser
+from roundTime_parser import RoundTimingParser
+from matchSummary_parser import MatchStatusParser
+
+
+# Parsers whose state is a plain dict driven by create_state/process_line/build_result,
+# with the state keys that only ever grow by appending
+RESUMABLE_PARSERS = {
+    "kills": (EnhancedKillParser, ("kills_data", "round_snapshots")),
+    "accuracy": (PlayerAccuracyParser, ("accuracy_events",)),
+    "damage": (WeaponDamageParser, ("damage_events",)),
+    "round_timings": (RoundTimingParser, ("actual_rounds",)),
+    "match_status": (MatchStatusParser, ("round_history",)),
+}
+
+# Parsers that accept stats_only=True to skip per-event arrays
+STATS_ONLY_PARSERS = {"kills", "accuracy", "damage"}
+
+CHECKPOINT_VERSION = 2
+
+
+class ResumableParse:
+    """Parse an append-only log in a way that survives crashes and restarts.
+
+    Every parser keeps all of its parse state in one JSON-serializable dict
+    (create_state), which is written to a checkpoint file every N lines and
+    after every Round_End, together with the byte offset it covers. Lists that
+    only grow, such as per-event records and round summaries, go to an
+    append-only sidecar instead, so each checkpoint writes only the new
+    entries and the aggregates; the checkpoint records how far the sidecar
+    is valid. A later run
+    loads the checkpoint, checks that the bytes before that offset are still
+    the same (hashes of the head and of the block just before the offset),
+    seeks there and only reads what was appended since. If the log was
+    replaced or truncated the checkpoint is ignored and parsing starts at 0.
+
+    The last non-blank line is held back from every checkpoint and the result
+    is built from a copy of the state, so the output stays identical to the
+    parser's own parse_* method on the whole file, even while a server is
+    still writing a partial line at the end.
+    """
+
+    def __init__(self, name: str, log_path: str, checkpoint_path: Optional[str] = None,
+                 stats_only: bool = False, checkpoint_every_lines: int = 10000,
+                 checkpoint_every_round: bool = True):
+        if name not in RESUMABLE_PARSERS:
+            raise ValueError(f"Parser {name} has no resumable state")
+
+        self.name = name
+        self.log_path = log_path
+        self.checkpoint_path = checkpoint_path or f"{log_path}.{name}.ckpt.json"
+        self.events_path = self.checkpoint_path + '.events.jsonl'
+        # Parsers without per-event arrays already produce only aggregates
+        self.stats_only = stats_only and name in STATS_ONLY_PARSERS
+        self.checkpoint_every_lines = checkpoint_every_lines
+        self.checkpoint_every_round = checkpoint_every_round
+        parser_class, self.event_keys = RESUMABLE_PARSERS[name]
+        self.events_written = {key: 0 for key in self.event_keys}
+        self.parser = parser_class(stats_only=True) if self.stats_only else parser_class()
+        self.hash_window = 4096
+        self.resumed_from = 0
+        self.offset = 0
+
+    def hash_range(self, file, start: int, end: int) -> str:
+        file.seek(start)
+        return hashlib.sha1(file.read(end - start)).hexdigest()
+
+    def fingerprint(self, file, offset: int) -> Dict:
+        """Hash the head of the file and the bytes just before offset."""
+        return {
+            "head_sha1": self.hash_range(file, 0, min(offset, self.hash_window)),
+            "tail_sha1": self.hash_range(file, max(0, offset - self.hash_window), offset)
+        }
+
+    def load_checkpoint(self, file, size: int) -> Optional[Dict]:
+        """Return the saved checkpoint if it still matches the log, otherwise None."""
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+        except ValueError:
+            return None
+
+        if (checkpoint.get("version") != CHECKPOINT_VERSION
+                or checkpoint.get("parser") != self.name
+                or checkpoint.get("stats_only") != self.stats_only
+                or checkpoint.get("offset", size + 1) > size):
+            return None
+        if checkpoint.get("fingerprint") != self.fingerprint(file, checkpoint["offset"]):
+            return None
+        if not os.path.exists(self.events_path) or os.path.getsize(self.events_path) < checkpoint["events_offset"]:
+            return None
+        return checkpoint
+
+    def restore_events(self, state: Dict, events_offset: int):
+        """Refill the append-only lists from the sidecar, dropping entries written after the checkpoint."""
+        with open(self.events_path, 'r+b') as events_file:
+            events_file.truncate(events_offset)
+            for raw_line in events_file:
+                key, item = json.loads(raw_line)
+                state[key].append(item)
+        for key in self.event_keys:
+            self.events_written[key] = len(state[key])
+
+    def save_checkpoint(self, file, state: Dict, offset: int, lines: int):
+        with open(self.events_path, 'ab') as events_file:
+            for key in self.event_keys:
+                for item in state[key][self.events_written[key]:]:
+                    events_file.write((json.dumps([key, item]) + '\n').encode('utf-8'))
+                self.events_written[key] = len(state[key])
+            events_file.flush()
+            os.fsync(events_file.fileno())
+            events_offset = events_file.tell()
+
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "parser": self.name,
+            "stats_only": self.stats_only,
+            "offset": offset,
+            "lines": lines,
+            "fingerprint": self.fingerprint(file, offset),
+            "events_offset": events_offset,
+            "state": {key: value for key, value in state.items() if key not in self.event_keys}
+        }
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.checkpoint_path)),
+                                         prefix=os.path.basename(self.checkpoint_path) + '.', suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temp_path, self.checkpoint_path)
+
+    def decode_line(self, raw_line: bytes) -> str:
+        # Match reading the log in text mode, where \r\n becomes \n
+        line = raw_line.decode('utf-8')
+        return line[:-1] if line.endswith('\r') else line
+
+    def run(self) -> Dict:
+        """Parse from the last valid checkpoint to the end of the log and return the full result."""
+        parser = self.parser
+        size = os.path.getsize(self.log_path)
+
+        with open(self.log_path, 'rb') as file:
+            checkpoint = self.load_checkpoint(file, size)
+            if checkpoint:
+                state, offset, lines = checkpoint["state"], checkpoint["offset"], checkpoint["lines"]
+                for key in self.event_keys:
+                    state[key] = []
+                self.restore_events(state, checkpoint["events_offset"])
+            else:
+                state, offset, lines = parser.create_state(), 0, 0
+                open(self.events_path, 'wb').close()
+            self.resumed_from = offset
+
+            # The last non-blank complete line and any blank lines after it are held
+            # back: parse_* strips the log, so they may still need trimming at the end
+            held: List[str] = []
+            held_bytes = 0
+            lines_since_checkpoint = 0
+
+            file.seek(offset)
+            for raw_line in file:
+                if not raw_line.endswith(b'\n'):
+                    break
+                line = self.decode_line(raw_line[:-1])
+
+                if line.strip():
+                    round_ended = False
+                    for held_line in held:
+                        if not lines:
+                            # Leading whitespace is stripped by parse_*
+                            held_line = held_line.lstrip()
+                            if not held_line:
+                                continue
+                        parser.process_line(state, held_line)
+                        lines += 1
+                        round_ended = round_ended or 'World triggered "Round_End"' in held_line
+                    offset += held_bytes
+                    lines_since_checkpoint += len(held)
+                    held, held_bytes = [], 0
+
+                    if ((self.checkpoint_every_round and round_ended)
+                            or lines_since_checkpoint >= self.checkpoint_every_lines):
+                        position = file.tell()
+                        self.save_checkpoint(file, state, offset, lines)
+                        file.seek(position)
+                        lines_since_checkpoint = 0
+
+                held.append(line)
+                held_bytes += len(raw_line)
+
+            if offset != self.resumed_from:
+                self.save_checkpoint(file, state, offset, lines)
+            self.offset = offset
+
+            file.seek(offset)
+            tail = file.read().decode('utf-8').replace('\r\n', '\n')
+
+        # Finish on a copy so the saved state never includes the held-back tail
+        result_state = json.loads(json.dumps(state))
+        tail = tail.strip() if not lines else tail.rstrip()
+        if tail or not lines:
+            for line in tail.split('\n'):
+                parser.process_line(result_state, line)
+        return parser.build_result(result_state)
+
+
+def main():
+    # Usage: python checkpointed_parser.py [parser] [log_path] [--stats-only]
+    args = [arg for arg in sys.argv[1:] if arg != '--stats-only']
+    stats_only = '--stats-only' in sys.argv[1:]
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    name = args[0] if args else "kills"
+    input_path = args[1] if len(args) > 1 else os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
+
+    try:
+        resumable = ResumableParse(name, input_path, stats_only=stats_only)
+        result = resumable.run()
+
+        print(f"\nResumable Parse ({name}):")
+        print(f"Resumed from byte {resumable.resumed_from}, checkpointed at byte {resumable.offset}")
+        print(f"Checkpoint: {resumable.checkpoint_path}")
+        print(f"Result keys: {', '.join(result.keys())}")
+
+    except FileNotFoundError:
+        print(f"Error: Could not find input file at {input_path}")
+    except Exception as e:
+        print(f"Error: An unexpected error occurred: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
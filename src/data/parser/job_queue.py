@@ -0,0 +1,410 @@
+import json
+import os
+import time
+import sqlite3
+import hashlib
+import argparse
+import tempfile
+import threading
+import multiprocessing
+from contextlib import closing
+from typing import Dict, List, Optional
+
+from kills_parser import EnhancedKillParser
+from playerAccuracy_parser import PlayerAccuracyParser
+from weapondDamage_parser import WeaponDamageParser
+from roundTime_parser import RoundTimingParser
+from matchSummary_parser import MatchStatusParser
+from chartSeries_parser import ChartSeriesParser
+from roundImpact_parser import RoundImpactParser
+from checkpointed_parser import RESUMABLE_PARSERS, STATS_ONLY_PARSERS, ResumableParse
+
+
+# Parser name -> (class, parse method name)
+PARSERS = {
+    "kills": (EnhancedKillParser, "parse_kills"),
+    "accuracy": (PlayerAccuracyParser, "parse_player_accuracy"),
+    "damage": (WeaponDamageParser, "parse_damage_events"),
+    "round_timings": (RoundTimingParser, "parse_round_timings"),
+    "match_status": (MatchStatusParser, "parse_match_status"),
+    "chart_series": (ChartSeriesParser, "parse_chart_series"),
+    "round_impact": (RoundImpactParser, "parse_round_impact"),
+}
+
+# Lower values are claimed first
+PRIORITY_LIVE = 0
+PRIORITY_DEFAULT = 50
+PRIORITY_BACKFILL = 100
+
+
+class JobQueue:
+    """Persistent local parse queue backed by a single SQLite file.
+
+    Jobs are claimed in priority order, so a live match enqueued behind a
+    season backfill is picked up by the next free worker. A job is
+    deduplicated by parser name, stats-only mode, output file and the SHA-256
+    of the log contents, failed jobs are retried with exponential backoff, and jobs left
+    running by a dead worker are handed out again once their lease expires.
+
+    Only one job per output file runs at a time, and a newer log for the same
+    output supersedes older jobs still pending. A claim is identified by the
+    job id and its attempt number; workers renew the lease while they parse,
+    and complete/fail are ignored once the claim has been handed to another
+    worker.
+    """
+
+    def __init__(self, db_path: str, lease_seconds: int = 600):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        with closing(self.connect()) as conn:
+            # Queues created before output_path was part of the dedup key are rebuilt
+            table = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'jobs'").fetchone()
+            migrate = table is not None and 'UNIQUE (parser, log_hash, stats_only)' in table[0]
+            if migrate:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("ALTER TABLE jobs RENAME TO jobs_old")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    parser TEXT NOT NULL,
+                    log_path TEXT NOT NULL,
+                    log_hash TEXT NOT NULL,
+                    output_path TEXT NOT NULL,
+                    stats_only INTEGER NOT NULL DEFAULT 0,
+                    priority INTEGER NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    available_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    error TEXT,
+                    UNIQUE (parser, log_hash, stats_only, output_path)
+                )
+            """)
+            if migrate:
+                conn.execute("INSERT INTO jobs SELECT * FROM jobs_old")
+                conn.execute("DROP TABLE jobs_old")
+                conn.execute("COMMIT")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, priority, id)")
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def hash_log(log_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(log_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def enqueue(self, parser: str, log_path: str, output_path: str,
+                priority: int = PRIORITY_DEFAULT, max_attempts: int = 3, stats_only: bool = False) -> int:
+        """Add a job, or return the existing one for the same parser, log contents and output.
+
+        Re-enqueueing a duplicate with a more urgent priority promotes it, and a
+        failed or superseded duplicate is reset so it runs again. Other pending
+        jobs writing the same output (an older copy of a growing live log) are
+        superseded.
+        """
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser '{parser}', expected one of {list(PARSERS)}")
+        # Parsers without per-event arrays already produce only aggregates
+        stats_only = stats_only and parser in STATS_ONLY_PARSERS
+        log_hash = self.hash_log(log_path)
+        output_path = os.path.abspath(output_path)
+        now = time.time()
+
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            existing = conn.execute(
+                "SELECT id, status, priority FROM jobs "
+                "WHERE parser = ? AND log_hash = ? AND stats_only = ? AND output_path = ?",
+                (parser, log_hash, int(stats_only), output_path)
+            ).fetchone()
+            if existing is None:
+                cursor = conn.execute(
+                    "INSERT INTO jobs (parser, log_path, log_hash, output_path, stats_only, priority, "
+                    "max_attempts, available_at, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (parser, os.path.abspath(log_path), log_hash, output_path,
+                     int(stats_only), priority, max_attempts, now, now)
+                )
+                job_id = cursor.lastrowid
+            else:
+                job_id = existing["id"]
+                if existing["status"] in ('failed', 'superseded'):
+                    conn.execute(
+                        "UPDATE jobs SET status = 'pending', attempts = 0, error = NULL, "
+                        "available_at = ?, priority = ? WHERE id = ?",
+                        (now, priority, job_id)
+                    )
+                elif priority < existing["priority"]:
+                    conn.execute("UPDATE jobs SET priority = ? WHERE id = ?", (priority, job_id))
+            conn.execute(
+                "UPDATE jobs SET status = 'superseded', finished_at = ? "
+                "WHERE output_path = ? AND id != ? AND status = 'pending'",
+                (now, output_path, job_id)
+            )
+            conn.execute("COMMIT")
+            return job_id
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def claim(self) -> Optional[Dict]:
+        """Atomically take the most urgent runnable job, or None if there is none."""
+        now = time.time()
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Reclaim jobs whose worker died mid-parse, giving up on jobs that
+            # keep killing their worker before they can fail()
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, "
+                "error = 'Lease expired: worker died ' || attempts || ' times' "
+                "WHERE status = 'running' AND started_at < ? AND attempts >= max_attempts",
+                (now, now - self.lease_seconds)
+            )
+            conn.execute(
+                "UPDATE jobs SET status = 'pending' WHERE status = 'running' AND started_at < ?",
+                (now - self.lease_seconds,)
+            )
+            # Never run two jobs writing the same output at once
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'pending' AND available_at <= ? "
+                "AND output_path NOT IN (SELECT output_path FROM jobs WHERE status = 'running') "
+                "ORDER BY priority, id LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ? WHERE id = ?",
+                (now, row["id"])
+            )
+            conn.execute("COMMIT")
+            job = dict(row)
+            job["attempts"] += 1
+            return job
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def renew(self, job: Dict) -> bool:
+        """Extend the lease of a claimed job; False if the claim was lost."""
+        with closing(self.connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET started_at = ? WHERE id = ? AND status = 'running' AND attempts = ?",
+                (time.time(), job["id"], job["attempts"])
+            )
+        return cursor.rowcount > 0
+
+    def heartbeat(self, job: Dict, stop: threading.Event):
+        """Renew the lease every third of its length until stop is set."""
+        while not stop.wait(self.lease_seconds / 3):
+            if not self.renew(job):
+                return
+
+    def complete(self, job: Dict):
+        with closing(self.connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'done', finished_at = ?, error = NULL "
+                "WHERE id = ? AND status = 'running' AND attempts = ?",
+                (time.time(), job["id"], job["attempts"])
+            )
+
+    def fail(self, job: Dict, error: str):
+        """Schedule a retry with exponential backoff, or give up after max_attempts."""
+        now = time.time()
+        with closing(self.connect()) as conn:
+            if job["attempts"] < job["max_attempts"]:
+                conn.execute(
+                    "UPDATE jobs SET status = 'pending', error = ?, available_at = ? "
+                    "WHERE id = ? AND status = 'running' AND attempts = ?",
+                    (error, now + 2 ** job["attempts"], job["id"], job["attempts"])
+                )
+            else:
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? "
+                    "WHERE id = ? AND status = 'running' AND attempts = ?",
+                    (error, now, job["id"], job["attempts"])
+                )
+
+    def has_unfinished(self) -> bool:
+        with closing(self.connect()) as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN ('pending', 'running')"
+            ).fetchone()
+        return row[0] > 0
+
+    def status_counts(self) -> Dict[str, int]:
+        with closing(self.connect()) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def list_jobs(self, limit: int = 50) -> List[Dict]:
+        with closing(self.connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs ORDER BY status = 'done', priority, id LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
+def run_job(job: Dict):
+    """Run one parse with the existing parser class and write its JSON output.
+
+    Parsers with resumable state keep a checkpoint next to the output, so a
+    crashed job or a re-enqueued live log that has grown only parses new bytes.
+    """
+    # The checkpoint lives next to the output, so the folder must exist first
+    os.makedirs(os.path.dirname(job["output_path"]), exist_ok=True)
+    if job["parser"] in RESUMABLE_PARSERS:
+        result = ResumableParse(job["parser"], job["log_path"], checkpoint_path=job["output_path"] + '.ckpt.json',
+                                stats_only=bool(job["stats_only"])).run()
+    else:
+        parser_class, method_name = PARSERS[job["parser"]]
+        with open(job["log_path"], 'r', encoding='utf-8') as file:
+            log_content = file.read()
+
+        parser = parser_class(stats_only=True) if job["stats_only"] else parser_class()
+        result = getattr(parser, method_name)(log_content)
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(job["output_path"]),
+                                     prefix=os.path.basename(job["output_path"]) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump(result, file, indent=2)
+        os.replace(temp_path, job["output_path"])
+    except Exception:
+        os.remove(temp_path)
+        raise
+
+
+def worker_loop(db_path: str, poll_seconds: float, forever: bool):
+    """Claim and run jobs until the queue is drained (or forever)."""
+    queue = JobQueue(db_path)
+    while True:
+        job = queue.claim()
+        if job is None:
+            if not forever and not queue.has_unfinished():
+                return
+            time.sleep(poll_seconds)
+            continue
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=queue.heartbeat, args=(job, stop), daemon=True)
+        heartbeat.start()
+        try:
+            run_job(job)
+            queue.complete(job)
+        except Exception as e:
+            queue.fail(job, f"{type(e).__name__}: {e}")
+        finally:
+            stop.set()
+            heartbeat.join()
+
+
+def run_workers(db_path: str, workers: int, poll_seconds: float = 1.0, forever: bool = False):
+    """Run worker processes until they drain the queue, replacing any that die."""
+    def start_worker() -> multiprocessing.Process:
+        process = multiprocessing.Process(target=worker_loop, args=(db_path, poll_seconds, forever))
+        process.start()
+        return process
+
+    processes = [start_worker() for _ in range(workers)]
+    while processes:
+        for process in list(processes):
+            process.join(timeout=poll_seconds)
+            if process.is_alive():
+                continue
+            processes.remove(process)
+            # A clean exit means the queue was drained; anything else was a crash
+            if process.exitcode != 0:
+                processes.append(start_worker())
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    default_db = os.path.join(script_dir, '../parse_jobs.sqlite3')
+
+    cli = argparse.ArgumentParser(description="Local priority queue for parser jobs")
+    cli.add_argument('--db', default=default_db, help="SQLite queue file")
+    commands = cli.add_subparsers(dest='command', required=True)
+
+    enqueue_cmd = commands.add_parser('enqueue', help="Queue parser jobs for one or more logs")
+    enqueue_cmd.add_argument('logs', nargs='+')
+    enqueue_cmd.add_argument('--parser', choices=list(PARSERS) + ['all'], default='all')
+    enqueue_cmd.add_argument('--output-dir', help="Defaults to a 'parsed' folder next to each log")
+    priority_group = enqueue_cmd.add_mutually_exclusive_group()
+    priority_group.add_argument('--live', action='store_true', help="Live match, runs before everything else")
+    priority_group.add_argument('--backfill', action='store_true', help="Historical backfill, runs last")
+    priority_group.add_argument('--priority', type=int)
+    enqueue_cmd.add_argument('--max-attempts', type=int, default=3)
+    enqueue_cmd.add_argument('--stats-only', action='store_true', help="Skip per-event arrays in the output")
+
+    work_cmd = commands.add_parser('work', help="Run worker processes")
+    work_cmd.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    work_cmd.add_argument('--forever', action='store_true', help="Keep polling once the queue is empty")
+    work_cmd.add_argument('--poll', type=float, default=1.0)
+
+    commands.add_parser('status', help="Show queued jobs")
+
+    args = cli.parse_args()
+
+    try:
+        queue = JobQueue(args.db)
+
+        if args.command == 'enqueue':
+            if args.live:
+                priority = PRIORITY_LIVE
+            elif args.backfill:
+                priority = PRIORITY_BACKFILL
+            elif args.priority is not None:
+                priority = args.priority
+            else:
+                priority = PRIORITY_DEFAULT
+            parsers = list(PARSERS) if args.parser == 'all' else [args.parser]
+
+            for log_path in args.logs:
+                output_dir = args.output_dir or os.path.join(os.path.dirname(os.path.abspath(log_path)), 'parsed')
+                log_name = os.path.splitext(os.path.basename(log_path))[0]
+                for parser in parsers:
+                    suffix = '.stats_only' if args.stats_only and parser in STATS_ONLY_PARSERS else ''
+                    output_path = os.path.join(output_dir, f"{log_name}.{parser}{suffix}.json")
+                    job_id = queue.enqueue(parser, log_path, output_path, priority, args.max_attempts,
+                                           args.stats_only)
+                    print(f"Job {job_id}: {parser} {log_path} (priority {priority})")
+
+        elif args.command == 'work':
+            run_workers(args.db, args.workers, args.poll, args.forever)
+            print("\nQueue drained:")
+            for status, count in queue.status_counts().items():
+                print(f"  {status}: {count}")
+
+        elif args.command == 'status':
+            print("\nJob Queue:")
+            for status, count in queue.status_counts().items():
+                print(f"  {status}: {count}")
+            for job in queue.list_jobs():
+                error = f" - {job['error']}" if job['error'] else ""
+                print(f"  #{job['id']} [{job['status']}] p{job['priority']} {job['parser']} "
+                      f"{os.path.basename(job['log_path'])} attempts {job['attempts']}{error}")
+
+    except FileNotFoundError as e:
+        print(f"Error: Could not find file {e.filename}")
+    except Exception as e:
+        print(f"Error: An unexpected error occurred: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import re
+import sys
 import json
 import os
 from datetime import datetime
@@ -6,7 +7,9 @@ from typing import Dict, List, Optional
 
 
 class EnhancedKillParser:
-    def __init__(self):
+    def __init__(self, stats_only: bool = False):
+        # In stats-only mode no per-kill records are built or returned
+        self.stats_only = stats_only
         self.timestamp_pattern = r'^(\d{2}/\d{2}/\d{4} - \d{2}:\d{2}:\d{2})'
         self.kill_pattern = r'"([^"]+)<\d+><STEAM_\d:\d:\d+><([^>]+)>" \[([-\d\s]+)\] killed "([^"]+)<\d+><STEAM_\d:\d:\d+><([^>]+)>" \[([-\d\s]+)\] with "([^"]+)"(\s*\(headshot\))?'
         self.match_start_pattern = r'World triggered "Match_Start"'
@@ -46,112 +49,124 @@ class EnhancedKillParser:
         return snapshot
 
     def parse_kills(self, log_content: str) -> Dict:
-        lines = log_content.strip().split('\n')
-
-        # Initialize tracking variables
-        live_started = False
-        match_started = False
-        current_round = 0
-        round_snapshots = []
-        current_round_start_time = None
-
-        kills_data = []
-        player_stats = {}
-        match_start_time = None
-        live_start_time = None
-
-        for line in lines:
-            timestamp_match = re.match(self.timestamp_pattern, line)
-            if not timestamp_match:
-                continue
-
-            timestamp = self.parse_timestamp(timestamp_match.group(1))
-            content = line[timestamp_match.end():].strip(': ')
-
-            # Check for LIVE! trigger
-            if not live_started and re.search(self.live_pattern, content):
-                live_started = True
-                live_start_time = timestamp
-                continue
-
-            # Skip lines before LIVE! trigger
-            if not live_started:
-                continue
-
-            # Check for round start
-            if re.search(self.round_start_pattern, content):
-                current_round += 1
-                current_round_start_time = timestamp
-                continue
-
-            # Check for round end
-            if re.search(self.round_end_pattern, content):
-                # Create a snapshot of the current stats for this round
-                round_snapshot = {
-                    "round_number": current_round,
-                    "start_time": current_round_start_time.strftime('%H:%M:%S'),
-                    "end_time": timestamp.strftime('%H:%M:%S'),
-                    "player_stats": self.create_round_snapshot(player_stats)
-                }
-                round_snapshots.append(round_snapshot)
-                continue
-
-            # Parse kill information
-            kill_match = re.search(self.kill_pattern, content)
-            if not kill_match:
-                continue
-
-            # Extract kill data
-            killer_name = kill_match.group(1)
-            killer_team = kill_match.group(2)
-            killer_pos = self.parse_position(kill_match.group(3))
-            victim_name = kill_match.group(4)
-            victim_team = kill_match.group(5)
-            victim_pos = self.parse_position(kill_match.group(6))
-            weapon = kill_match.group(7)
-            is_headshot = bool(kill_match.group(8))
-
-            # Initialize stats for new players
-            if killer_name not in player_stats:
-                player_stats[killer_name] = self.initialize_player_stats()
-            if victim_name not in player_stats:
-                player_stats[victim_name] = self.initialize_player_stats()
-
-            # Record kill data with round number
+        state = self.create_state()
+        for line in log_content.strip().split('\n'):
+            self.process_line(state, line)
+        return self.build_result(state)
+
+    def create_state(self) -> Dict:
+        return {
+            "live_started": False,
+            "current_round": 0,
+            "current_round_start_time": None,
+            "live_start_time": None,
+            "match_start_time": None,
+            "total_kills": 0,
+            "player_stats": {},
+            "kills_data": [],
+            "round_snapshots": []
+        }
+
+    def process_line(self, state: Dict, line: str):
+        timestamp_match = re.match(self.timestamp_pattern, line)
+        if not timestamp_match:
+            return
+
+        content = line[timestamp_match.end():].strip(': ')
+
+        # Check for LIVE! trigger
+        if not state["live_started"] and re.search(self.live_pattern, content):
+            state["live_started"] = True
+            state["live_start_time"] = self.parse_timestamp(timestamp_match.group(1)).strftime('%H:%M:%S')
+            return
+
+        # Skip lines before LIVE! trigger
+        if not state["live_started"]:
+            return
+
+        # Check for round start
+        if re.search(self.round_start_pattern, content):
+            state["current_round"] += 1
+            state["current_round_start_time"] = self.parse_timestamp(timestamp_match.group(1)).strftime('%H:%M:%S')
+            return
+
+        player_stats = state["player_stats"]
+
+        # Check for round end
+        if re.search(self.round_end_pattern, content):
+            # Create a snapshot of the current stats for this round
+            round_snapshot = {
+                "round_number": state["current_round"],
+                "start_time": state["current_round_start_time"],
+                "end_time": self.parse_timestamp(timestamp_match.group(1)).strftime('%H:%M:%S'),
+                "player_stats": self.create_round_snapshot(player_stats)
+            }
+            state["round_snapshots"].append(round_snapshot)
+            return
+
+        # Parse kill information
+        kill_match = re.search(self.kill_pattern, content)
+        if not kill_match:
+            return
+
+        # Extract kill data
+        killer_name = kill_match.group(1)
+        killer_team = kill_match.group(2)
+        victim_name = kill_match.group(4)
+        victim_team = kill_match.group(5)
+        weapon = kill_match.group(7)
+        is_headshot = bool(kill_match.group(8))
+
+        # Initialize stats for new players
+        if killer_name not in player_stats:
+            player_stats[killer_name] = self.initialize_player_stats()
+        if victim_name not in player_stats:
+            player_stats[victim_name] = self.initialize_player_stats()
+
+        # Record kill data with round number
+        state["total_kills"] += 1
+        if not self.stats_only:
             kill_data = {
-                "round": current_round,
-                "timestamp": timestamp.strftime('%H:%M:%S'),
+                "round": state["current_round"],
+                "timestamp": self.parse_timestamp(timestamp_match.group(1)).strftime('%H:%M:%S'),
                 "killer": {
                     "name": killer_name,
                     "team": killer_team,
-                    "position": killer_pos
+                    "position": self.parse_position(kill_match.group(3))
                 },
                 "victim": {
                     "name": victim_name,
                     "team": victim_team,
-                    "position": victim_pos
+                    "position": self.parse_position(kill_match.group(6))
                 },
                 "weapon": weapon,
                 "headshot": is_headshot
             }
-            kills_data.append(kill_data)
+            state["kills_data"].append(kill_data)
+
+        # Update statistics
+        self.update_player_stats(player_stats, killer_name, victim_name, weapon, is_headshot,
+                                 killer_team == victim_team)
 
-            # Update statistics
-            self.update_player_stats(player_stats, killer_name, victim_name, weapon, is_headshot,
-                                     killer_team == victim_team)
+    def build_result(self, state: Dict) -> Dict:
+        """Format the output; this finalizes the stats in place, so pass a copy to keep parsing."""
+        player_stats = state["player_stats"]
 
         # Calculate final statistics
         self.calculate_final_stats(player_stats)
 
-        return {
-            "live_start_time": live_start_time.strftime('%H:%M:%S') if live_start_time else None,
-            "match_start_time": match_start_time.strftime('%H:%M:%S') if match_start_time else None,
-            "total_kills": len(kills_data),
-            "total_rounds": current_round,
+        result = {
+            "live_start_time": state["live_start_time"],
+            "match_start_time": state["match_start_time"],
+            "total_kills": state["total_kills"],
+            "total_rounds": state["current_round"],
             "player_stats": player_stats,
-            "kills": kills_data,
-            "round_stats": round_snapshots
+            "kills": state["kills_data"],
+            "round_stats": state["round_snapshots"]
         }
+        if self.stats_only:
+            del result["kills"]
+        return result
 
     def update_player_stats(self, player_stats: Dict, killer: str, victim: str, weapon: str, is_headshot: bool,
                             is_team_kill: bool):
@@ -169,6 +184,22 @@ class EnhancedKillParser:
         # Update victim statistics
         player_stats[victim]["deaths"] += 1
 
+    def merge_player_stats(self, base: Dict, partial: Dict) -> Dict:
+        """Add counters parsed from a later slice of the log onto earlier cumulative stats.
+
+        headshot_percentage is left as in base; calculate_final_stats fills it in.
+        """
+        merged = self.create_round_snapshot(base)
+        for player, stats in partial.items():
+            if player not in merged:
+                merged[player] = self.initialize_player_stats()
+            target = merged[player]
+            for key in ("total_kills", "deaths", "headshots", "team_kills"):
+                target[key] += stats[key]
+            for weapon, count in stats["weapons"].items():
+                target["weapons"][weapon] = target["weapons"].get(weapon, 0) + count
+        return merged
+
     def calculate_final_stats(self, player_stats: Dict):
         """Calculate final statistics for all players."""
         for player in player_stats:
@@ -180,10 +211,13 @@ class EnhancedKillParser:
 
 
 def main():
-    parser = EnhancedKillParser()
+    # Pass --stats-only to skip per-kill records and write kill_stats_stats_only.json
+    stats_only = '--stats-only' in sys.argv[1:]
+    parser = EnhancedKillParser(stats_only=stats_only)
     script_dir = os.path.dirname(os.path.abspath(__file__))
     input_path = os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
-    output_path = os.path.join(script_dir, '../../../public/data/kill_stats.json')
+    output_name = 'kill_stats_stats_only.json' if stats_only else 'kill_stats.json'
+    output_path = os.path.join(script_dir, '../../../public/data', output_name)
 
     try:
         with open(input_path, 'r', encoding='utf-8') as file:
@@ -0,0 +1,307 @@
+import json
+import os
+import bisect
+import time
+import zlib
+from urllib.parse import quote, unquote
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LogArchive:
+    """Append-only archive of raw server logs stored as independent zlib blocks.
+
+    The data file holds the compressed blocks of every archived match back to
+    back. A sidecar index folder holds one JSON file per match recording
+    where each block lives and which block holds every Match_Start, LIVE!,
+    Round_Start and Round_End marker, so a round range can be read by loading
+    that match's index and decompressing only its blocks. Adding a match
+    writes only its own index file.
+    """
+
+    def __init__(self, archive_path: str, block_size: int = 64 * 1024, compression_level: int = 6):
+        self.archive_path = archive_path
+        self.index_dir = archive_path + '.idx'
+        self.legacy_index_path = archive_path + '.idx.json'
+        self.lock_path = archive_path + '.lock'
+        self.block_size = block_size
+        self.compression_level = compression_level
+        self.marker_patterns = {
+            "Match_Start": 'World triggered "Match_Start"',
+            "LIVE": '[FACEIT^] LIVE!',
+            "Round_Start": 'World triggered "Round_Start"',
+            "Round_End": 'World triggered "Round_End"',
+            "Team_Playing": 'MatchStatus: Team playing',
+        }
+        if os.path.exists(self.legacy_index_path):
+            self.split_legacy_index()
+
+    def split_legacy_index(self):
+        """Move matches from the old single-file index into per-match index files."""
+        with self.locked():
+            if not os.path.exists(self.legacy_index_path):
+                return
+            with open(self.legacy_index_path, 'r', encoding='utf-8') as file:
+                legacy = json.load(file)
+            for match_id, match_index in legacy["matches"].items():
+                self.save_match_index(match_id, match_index)
+            os.remove(self.legacy_index_path)
+
+    def match_index_path(self, match_id: str) -> str:
+        return os.path.join(self.index_dir, quote(match_id, safe='') + '.json')
+
+    def load_match_index(self, match_id: str) -> Dict:
+        with open(self.match_index_path(match_id), 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def save_match_index(self, match_id: str, match_index: Dict):
+        os.makedirs(self.index_dir, exist_ok=True)
+        index_path = self.match_index_path(match_id)
+        temp_path = index_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(match_index, file)
+        os.replace(temp_path, index_path)
+
+    @contextmanager
+    def locked(self):
+        """Hold an exclusive lock on the archive across processes."""
+        with open(self.lock_path, 'a+b') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def detect_marker(self, line: str) -> Optional[str]:
+        for marker, pattern in self.marker_patterns.items():
+            if pattern in line:
+                return marker
+        return None
+
+    def add_match(self, match_id: str, log_content: str):
+        """Compress a match log into blocks and record its markers in the index."""
+        # The lock keeps concurrent writers from interleaving their blocks
+        with self.locked():
+            if self.has_match(match_id):
+                raise ValueError(f"Match '{match_id}' is already archived")
+
+            blocks = []
+            markers = []
+            block_lines = []
+            block_raw_start = 0
+            raw_offset = 0
+
+            with open(self.archive_path, 'ab') as archive:
+                def flush_block():
+                    raw = ''.join(block_lines).encode('utf-8')
+                    compressed = zlib.compress(raw, self.compression_level)
+                    blocks.append({
+                        "offset": archive.tell(),
+                        "length": len(compressed),
+                        "raw_offset": block_raw_start,
+                        "raw_length": len(raw)
+                    })
+                    archive.write(compressed)
+
+                # Split on \n only, so every byte of the log is kept as it was
+                lines = log_content.split('\n')
+                lines = [line + '\n' for line in lines[:-1]] + ([lines[-1]] if lines[-1] else [])
+                for line in lines:
+                    marker = self.detect_marker(line)
+
+                    # Start a fresh block at each round start so a round never needs
+                    # the tail of the previous round decoded
+                    block_full = raw_offset - block_raw_start >= self.block_size
+                    if block_lines and (marker == "Round_Start" or block_full):
+                        flush_block()
+                        block_lines = []
+                        block_raw_start = raw_offset
+
+                    line_length = len(line.encode('utf-8'))
+                    if marker:
+                        markers.append({
+                            "type": marker,
+                            "block": len(blocks),
+                            "raw_offset": raw_offset,
+                            "raw_end": raw_offset + line_length,
+                            "line": line.rstrip('\r\n')
+                        })
+
+                    block_lines.append(line)
+                    raw_offset += line_length
+
+                if block_lines:
+                    flush_block()
+
+            self.save_match_index(match_id, {
+                "raw_length": raw_offset,
+                "blocks": blocks,
+                "markers": markers
+            })
+
+    def add_match_file(self, match_id: str, log_path: str):
+        # newline='' keeps \r\n and other line endings exactly as written
+        with open(log_path, 'r', encoding='utf-8', newline='') as file:
+            self.add_match(match_id, file.read())
+
+    def has_match(self, match_id: str) -> bool:
+        return os.path.exists(self.match_index_path(match_id))
+
+    def list_matches(self) -> List[str]:
+        if not os.path.isdir(self.index_dir):
+            return []
+        return sorted(unquote(name[:-len('.json')]) for name in os.listdir(self.index_dir)
+                      if name.endswith('.json'))
+
+    def open_match(self, match_id: str) -> 'ArchivedMatch':
+        if not self.has_match(match_id):
+            raise KeyError(f"Match '{match_id}' is not in the archive")
+        return ArchivedMatch(self.archive_path, self.load_match_index(match_id))
+
+
+class ArchivedMatch:
+    """Random access to the rounds of one archived match.
+
+    Rounds are numbered and bounded the way EnhancedKillParser and RoundIndex
+    see them: every Round_Start after the first LIVE! trigger, starting at 1,
+    running until the next Round_Start so kills logged after Round_End stay
+    in their round.
+    """
+
+    def __init__(self, archive_path: str, match_index: Dict):
+        self.archive_path = archive_path
+        self.blocks = match_index["blocks"]
+        self.markers = match_index["markers"]
+        self.raw_length = match_index["raw_length"]
+        self.block_starts = [block["raw_offset"] for block in self.blocks]
+        self.rounds = self.build_round_table()
+
+    def build_round_table(self) -> List[Dict]:
+        """Split the log into rounds at every live Round_Start marker."""
+        live_seen = not any(m["type"] == "LIVE" for m in self.markers)
+        rounds = []
+        for marker in self.markers:
+            if marker["type"] == "LIVE":
+                live_seen = True
+            elif live_seen and marker["type"] == "Round_Start":
+                if rounds:
+                    rounds[-1]["end"] = marker["raw_offset"]
+                rounds.append({"start": marker["raw_offset"], "end": self.raw_length})
+        return rounds
+
+    @property
+    def total_rounds(self) -> int:
+        return len(self.rounds)
+
+    def read_bytes(self, start: int, end: int) -> bytes:
+        """Decode only the blocks overlapping the raw byte range [start, end)."""
+        if start >= end or not self.blocks:
+            return b''
+        first_block = max(bisect.bisect_right(self.block_starts, start) - 1, 0)
+        last_block = bisect.bisect_left(self.block_starts, end)
+        first_raw = self.block_starts[first_block]
+
+        chunks = []
+        with open(self.archive_path, 'rb') as archive:
+            for block in self.blocks[first_block:last_block]:
+                archive.seek(block["offset"])
+                chunks.append(zlib.decompress(archive.read(block["length"])))
+        data = b''.join(chunks)
+        return data[start - first_raw:end - first_raw]
+
+    def context_lines(self, before: int) -> List[str]:
+        """Marker lines the parsers need to see before a round range.
+
+        These are the first Match_Start and LIVE! triggers and the latest team
+        assignments, all taken from the index without decoding any block.
+        """
+        lines = []
+        for marker_type in ("Match_Start", "LIVE"):
+            for marker in self.markers:
+                if marker["type"] == marker_type and marker["raw_offset"] < before:
+                    lines.append(marker)
+                    break
+        team_lines = {}
+        for marker in self.markers:
+            if marker["raw_offset"] >= before:
+                break
+            if marker["type"] == "Team_Playing":
+                side = "CT" if '"CT"' in marker["line"] else "TERRORIST"
+                team_lines[side] = marker
+        lines.extend(team_lines.values())
+        lines.sort(key=lambda m: m["raw_offset"])
+        return [m["line"] for m in lines]
+
+    def read_rounds(self, first_round: int, last_round: Optional[int] = None) -> str:
+        """Return log text for rounds first_round..last_round (inclusive).
+
+        The text is prefixed with the context lines so it can be passed straight
+        to any parse_* method; round numbers in that output start again at 1.
+        """
+        last_round = first_round if last_round is None else last_round
+        if not 1 <= first_round <= last_round <= self.total_rounds:
+            raise IndexError(f"Round range {first_round}-{last_round} outside 1-{self.total_rounds}")
+
+        start = self.rounds[first_round - 1]["start"]
+        end = self.rounds[last_round - 1]["end"]
+        body = self.read_bytes(start, end).decode('utf-8')
+        context = self.context_lines(start)
+        return '\n'.join(context + [body]) if context else body
+
+    def read_all(self) -> str:
+        return self.read_bytes(0, self.raw_length).decode('utf-8')
+
+
+def main():
+    from kills_parser import EnhancedKillParser
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    input_path = os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
+    archive_path = os.path.join(script_dir, '../archive/matches.clog')
+    match_id = 'NAVIvsVitaGF-Nuke'
+
+    try:
+        os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+        archive = LogArchive(archive_path)
+        if not archive.has_match(match_id):
+            archive.add_match_file(match_id, input_path)
+
+        match = archive.open_match(match_id)
+        blocks = match.blocks
+        compressed = sum(b["length"] for b in blocks)
+
+        print("\nLog Archive Summary:")
+        print(f"Matches: {len(archive.list_matches())}")
+        print(f"Blocks: {len(blocks)} ({match.raw_length} bytes -> {compressed} bytes)")
+        print(f"Rounds: {match.total_rounds}")
+
+        start = time.perf_counter()
+        round_log = match.read_rounds(1)
+        elapsed = (time.perf_counter() - start) * 1000
+        kill_data = EnhancedKillParser().parse_kills(round_log)
+
+        print(f"\nRound 1: read in {elapsed:.2f} ms, "
+              f"{kill_data['total_kills']} kills")
+
+    except FileNotFoundError:
+        print(f"Error: Could not find input file at {input_path}")
+    except Exception as e:
+        print(f"Error: An unexpected error occurred: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,16 +17,19 @@ class MatchStatusParser:
         return None
 
     def parse_match_status(self, log_content: str) -> Dict:
-        lines = log_content.strip().split('\n')
+        state = self.create_state()
+        for line in log_content.strip().split('\n'):
+            self.process_line(state, line)
+        return self.build_result(state)
 
+    def create_state(self) -> Dict:
         # Initialize match status
         match_status = {
             "current_round": 0,
             "score": {"CT": 0, "T": 0},
             "teams": {"CT": "", "T": ""},
             "rounds": [],
-            "map": "",
-            "round_history": []
+            "map": ""
         }
 
         current_round_data = {
@@ -35,63 +38,74 @@ class MatchStatusParser:
             "end_reason": None
         }
 
-        for line in lines:
-            timestamp_match = re.match(self.timestamp_pattern, line)
-            if not timestamp_match:
-                continue
-
-            timestamp = timestamp_match.group(1)
-            content = line[timestamp_match.end():].strip()
-
-            # Check for round winner first
-            round_winner = self.determine_round_winner(content)
-            if round_winner:
-                current_round_data["winner"] = round_winner
-                continue
-
-            # Parse team scores
-            team_score_match = re.match(r'Team "(CT|TERRORIST)" scored "(\d+)" with "(\d+)" players', content)
-            if team_score_match:
-                team, score, players = team_score_match.groups()
-                match_status["score"]["CT" if team == "CT" else "T"] = int(score)
-                continue
-
-            # Parse team names
-            team_playing_match = re.match(r'MatchStatus: Team playing "(CT|TERRORIST)": (.+)', content)
-            if team_playing_match:
-                team, name = team_playing_match.groups()
-                match_status["teams"]["CT" if team == "CT" else "T"] = name
-                continue
-
-            # Parse match status line
-            status_match = re.match(r'MatchStatus: Score: (\d+):(\d+) on map "([^"]+)" RoundsPlayed: (-?\d+)', content)
-            if status_match:
-                ct_score, t_score, map_name, rounds_played = status_match.groups()
-                match_status["score"]["CT"] = int(ct_score)
-                match_status["score"]["T"] = int(t_score)
-                match_status["map"] = map_name
-                match_status["current_round"] = max(1, int(rounds_played))
-                continue
-
-            # Parse round end
-            if 'World triggered "Round_End"' in content:
-                if current_round_data["winner"]:
-                    winning_team = match_status["teams"][current_round_data["winner"]]
-                    round_summary = {
-                        "round_number": match_status["current_round"],
-                        "winner_side": current_round_data["winner"],
-                        "winner_team": winning_team,
-                        "score_after_round": f"{match_status['score']['CT']}:{match_status['score']['T']}"
-                    }
-                    match_status["round_history"].append(round_summary)
-
-                # Reset for next round
-                current_round_data = {
-                    "round_number": match_status["current_round"] + 1,
-                    "winner": None,
-                    "end_reason": None
+        return {
+            "match_status": match_status,
+            "current_round_data": current_round_data,
+            "round_history": []
+        }
+
+    def process_line(self, state: Dict, line: str):
+        match_status = state["match_status"]
+
+        timestamp_match = re.match(self.timestamp_pattern, line)
+        if not timestamp_match:
+            return
+
+        timestamp = timestamp_match.group(1)
+        content = line[timestamp_match.end():].strip()
+
+        # Check for round winner first
+        round_winner = self.determine_round_winner(content)
+        if round_winner:
+            state["current_round_data"]["winner"] = round_winner
+            return
+
+        # Parse team scores
+        team_score_match = re.match(r'Team "(CT|TERRORIST)" scored "(\d+)" with "(\d+)" players', content)
+        if team_score_match:
+            team, score, players = team_score_match.groups()
+            match_status["score"]["CT" if team == "CT" else "T"] = int(score)
+            return
+
+        # Parse team names
+        team_playing_match = re.match(r'MatchStatus: Team playing "(CT|TERRORIST)": (.+)', content)
+        if team_playing_match:
+            team, name = team_playing_match.groups()
+            match_status["teams"]["CT" if team == "CT" else "T"] = name
+            return
+
+        # Parse match status line
+        status_match = re.match(r'MatchStatus: Score: (\d+):(\d+) on map "([^"]+)" RoundsPlayed: (-?\d+)', content)
+        if status_match:
+            ct_score, t_score, map_name, rounds_played = status_match.groups()
+            match_status["score"]["CT"] = int(ct_score)
+            match_status["score"]["T"] = int(t_score)
+            match_status["map"] = map_name
+            match_status["current_round"] = max(1, int(rounds_played))
+            return
+
+        # Parse round end
+        if 'World triggered "Round_End"' in content:
+            if state["current_round_data"]["winner"]:
+                winning_team = match_status["teams"][state["current_round_data"]["winner"]]
+                round_summary = {
+                    "round_number": match_status["current_round"],
+                    "winner_side": state["current_round_data"]["winner"],
+                    "winner_team": winning_team,
+                    "score_after_round": f"{match_status['score']['CT']}:{match_status['score']['T']}"
                 }
-                continue
+                state["round_history"].append(round_summary)
+
+            # Reset for next round
+            state["current_round_data"] = {
+                "round_number": match_status["current_round"] + 1,
+                "winner": None,
+                "end_reason": None
+            }
+            return
+
+    def build_result(self, state: Dict) -> Dict:
+        match_status = state["match_status"]
 
         # Format final output
         match_summary = {
@@ -104,7 +118,7 @@ class MatchStatusParser:
                 "T": match_status["teams"]["T"]
             },
             "total_rounds": match_status["current_round"],
-            "round_history": match_status["round_history"]
+            "round_history": state["round_history"]
         }
 
         return match_summary
@@ -0,0 +1,328 @@
+import re
+import json
+import os
+import sys
+import time
+import random
+import importlib
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from kills_parser import EnhancedKillParser
+from playerAccuracy_parser import PlayerAccuracyParser
+from weapondDamage_parser import WeaponDamageParser
+from roundTime_parser import RoundTimingParser
+from matchSummary_parser import MatchStatusParser
+
+
+# Reference implementations: parser name -> (class, parse method name)
+REFERENCE_PARSERS = {
+    "kills": (EnhancedKillParser, "parse_kills"),
+    "accuracy": (PlayerAccuracyParser, "parse_player_accuracy"),
+    "damage": (WeaponDamageParser, "parse_damage_events"),
+    "round_timings": (RoundTimingParser, "parse_round_timings"),
+    "match_status": (MatchStatusParser, "parse_match_status"),
+}
+
+# Top-level output keys that hold per-event arrays
+EVENT_KEYS = {"kills", "events", "damage_events", "rounds", "round_history", "round_stats"}
+
+
+def reference_parse(name: str) -> Callable[[str], Dict]:
+    """Return a callable that runs the reference parser for the given name."""
+    parser_class, method_name = REFERENCE_PARSERS[name]
+    return getattr(parser_class(), method_name)
+
+
+class LogMutator:
+    """Generate mutated variants of a server log to exercise parser edge cases."""
+
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.timestamp_pattern = r'^(\d{2}/\d{2}/\d{4} - \d{2}:\d{2}:\d{2}): '
+        self.player_pattern = r'"([^"<]+)<\d+><STEAM_\d:\d:\d+><(?:CT|TERRORIST)>"'
+        self.significant_markers = (
+            'World triggered', 'killed', 'attacked', 'assisted', 'MatchStatus',
+            'scored', 'SFUI_Notice', 'LIVE!'
+        )
+
+    def is_noise(self, line: str) -> bool:
+        """A line is noise if none of the parsers react to it."""
+        return not any(marker in line for marker in self.significant_markers)
+
+    def reorder_noise(self, lines: List[str]) -> List[str]:
+        """Shuffle each run of consecutive noise lines, keeping event lines in place."""
+        result = []
+        run = []
+        for line in lines:
+            if self.is_noise(line):
+                run.append(line)
+                continue
+            self.rng.shuffle(run)
+            result.extend(run)
+            run = []
+            result.append(line)
+        self.rng.shuffle(run)
+        result.extend(run)
+        return result
+
+    def find_rounds(self, lines: List[str]) -> List[Tuple[int, int]]:
+        """Return (start, end) line indices of every Round_Start..Round_End block."""
+        rounds = []
+        start = None
+        for i, line in enumerate(lines):
+            if 'World triggered "Round_Start"' in line:
+                start = i
+            elif 'World triggered "Round_End"' in line and start is not None:
+                rounds.append((start, i))
+                start = None
+        return rounds
+
+    def add_overtime(self, lines: List[str], overtime_rounds: int = 6) -> List[str]:
+        """Replay the last completed rounds after it to simulate overtime."""
+        rounds = self.find_rounds(lines)
+        if not rounds:
+            return list(lines)
+        replayed = rounds[-overtime_rounds:]
+        insert_at = rounds[-1][1] + 1
+        overtime = []
+        for start, end in replayed:
+            overtime.extend(lines[start:end + 1])
+        return lines[:insert_at] + overtime + lines[insert_at:]
+
+    def add_restart(self, lines: List[str]) -> List[str]:
+        """Insert a mid-match restart (Match_Start + LIVE!) between two rounds."""
+        rounds = self.find_rounds(lines)
+        if len(rounds) < 2:
+            return list(lines)
+        insert_at = rounds[self.rng.randrange(1, len(rounds))][0]
+        timestamp_match = re.match(self.timestamp_pattern, lines[insert_at])
+        prefix = timestamp_match.group(0) if timestamp_match else ''
+        restart = [
+            prefix + 'World triggered "Restart_Round_(1_second)"',
+            prefix + 'World triggered "Match_Start" on "de_nuke"',
+            prefix + ' [FACEIT^] LIVE!',
+        ]
+        return lines[:insert_at] + restart + lines[insert_at:]
+
+    def rename_players(self, lines: List[str]) -> List[str]:
+        """Rename players to names containing quotes and brackets."""
+        names = []
+        for line in lines:
+            for name in re.findall(self.player_pattern, line):
+                if name not in names:
+                    names.append(name)
+        odd_names = ['"{}"', '[{}]', '{} [NaVi]', "'{}'", '({})"', '{}]["']
+        renames = {
+            name: odd_names[i % len(odd_names)].format(name)
+            for i, name in enumerate(self.rng.sample(names, min(len(names), len(odd_names))))
+        }
+        result = []
+        for line in lines:
+            for old, new in renames.items():
+                line = line.replace(f'"{old}<', f'"{new}<')
+            result.append(line)
+        return result
+
+    def generate_cases(self, log_content: str) -> Iterator[Tuple[str, str]]:
+        """Yield (case name, log content) pairs: the original log and its mutations."""
+        lines = log_content.split('\n')
+        yield "original", log_content
+        yield "reordered_noise", '\n'.join(self.reorder_noise(lines))
+        yield "overtime", '\n'.join(self.add_overtime(lines))
+        yield "restart", '\n'.join(self.add_restart(lines))
+        yield "odd_player_names", '\n'.join(self.rename_players(lines))
+        combined = self.rename_players(self.add_restart(self.add_overtime(self.reorder_noise(lines))))
+        yield "combined", '\n'.join(combined)
+
+
+def find_divergence(expected, actual, path: str = "$") -> Optional[Dict]:
+    """Return the first point where two JSON values differ, or None if identical.
+
+    Dict key order is part of the comparison since it changes the written bytes.
+    """
+    if type(expected) is not type(actual):
+        return {"path": path, "expected": expected, "actual": actual}
+
+    if isinstance(expected, dict):
+        expected_keys = list(expected.keys())
+        actual_keys = list(actual.keys())
+        for key in expected_keys:
+            if key not in actual:
+                return {"path": f"{path}.{key}", "expected": expected[key], "actual": "<missing>"}
+            divergence = find_divergence(expected[key], actual[key], f"{path}.{key}")
+            if divergence:
+                return divergence
+        for key in actual_keys:
+            if key not in expected:
+                return {"path": f"{path}.{key}", "expected": "<missing>", "actual": actual[key]}
+        if expected_keys != actual_keys:
+            return {"path": path, "expected": expected_keys, "actual": actual_keys}
+        return None
+
+    if isinstance(expected, list):
+        for i, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+            divergence = find_divergence(expected_item, actual_item, f"{path}[{i}]")
+            if divergence:
+                return divergence
+        if len(expected) != len(actual):
+            i = min(len(expected), len(actual))
+            return {
+                "path": f"{path}[{i}]",
+                "expected": expected[i] if i < len(expected) else "<missing>",
+                "actual": actual[i] if i < len(actual) else "<missing>"
+            }
+        return None
+
+    if expected != actual:
+        return {"path": path, "expected": expected, "actual": actual}
+    return None
+
+
+def first_divergent_event(expected: Dict, actual: Dict, divergence: Dict) -> Optional[Dict]:
+    """Attach the full event records when the divergence sits inside an event array."""
+    event_match = re.match(r'^\$\.(\w+)\[(\d+)\]', divergence["path"])
+    if not event_match or event_match.group(1) not in EVENT_KEYS:
+        return None
+    key, index = event_match.group(1), int(event_match.group(2))
+    expected_events = expected.get(key, [])
+    actual_events = actual.get(key, [])
+    return {
+        "array": key,
+        "index": index,
+        "expected": expected_events[index] if index < len(expected_events) else None,
+        "actual": actual_events[index] if index < len(actual_events) else None
+    }
+
+
+def time_parse(parse: Callable[[str], Dict], log_content: str, repeats: int) -> Tuple[Dict, float]:
+    """Run a parse several times, returning its JSON-normalized output and best time."""
+    best = float('inf')
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = parse(log_content)
+        best = min(best, time.perf_counter() - start)
+    return json.loads(json.dumps(result)), best
+
+
+def compare_parsers(name: str, candidate: Callable[[str], Dict], log_content: str,
+                    case: str = "original", repeats: int = 3) -> Dict:
+    """Run the reference and candidate parsers on one log and diff their outputs.
+
+    A parser that raises is reported as a divergence at the root, with the
+    exception text in place of its output.
+    """
+    errors = {}
+    try:
+        expected, reference_time = time_parse(reference_parse(name), log_content, repeats)
+    except Exception as e:
+        expected, reference_time = None, None
+        errors["expected"] = f"<{type(e).__name__}: {e}>"
+    try:
+        actual, candidate_time = time_parse(candidate, log_content, repeats)
+    except Exception as e:
+        actual, candidate_time = None, None
+        errors["actual"] = f"<{type(e).__name__}: {e}>"
+
+    if errors:
+        divergence = {
+            "path": "$",
+            "expected": errors.get("expected", "<output>"),
+            "actual": errors.get("actual", "<output>")
+        }
+    else:
+        divergence = find_divergence(expected, actual)
+        if divergence is None and json.dumps(expected, indent=2) != json.dumps(actual, indent=2):
+            divergence = {"path": "$", "expected": "<bytes>", "actual": "<bytes>"}
+
+    timed = reference_time is not None and candidate_time is not None
+    return {
+        "parser": name,
+        "case": case,
+        "identical": divergence is None,
+        "crashed": bool(errors),
+        "divergence": divergence,
+        "divergent_event": first_divergent_event(expected, actual, divergence) if divergence and not errors else None,
+        "reference_seconds": round(reference_time, 6) if reference_time is not None else None,
+        "candidate_seconds": round(candidate_time, 6) if candidate_time is not None else None,
+        "speedup": round(reference_time / candidate_time, 3) if timed and candidate_time > 0 else None
+    }
+
+
+def run_harness(candidates: Dict[str, Callable[[str], Dict]], log_content: str,
+                seed: int = 0, repeats: int = 3) -> List[Dict]:
+    """Compare every candidate against its reference over the log and its mutations."""
+    results = []
+    mutator = LogMutator(seed)
+    for case, content in mutator.generate_cases(log_content):
+        for name, candidate in candidates.items():
+            results.append(compare_parsers(name, candidate, content, case, repeats))
+    return results
+
+
+def load_candidate(spec: str) -> Callable[[str], Dict]:
+    """Load a candidate from a 'module:Class.method' or 'module:function' spec."""
+    module_name, _, attr = spec.partition(':')
+    target = importlib.import_module(module_name)
+    class_name, _, method_name = attr.partition('.')
+    target = getattr(target, class_name)
+    if method_name:
+        target = getattr(target(), method_name)
+    return target
+
+
+def main():
+    # Usage: python parser_harness.py [name=module:Class.method ...]
+    # Without arguments every reference parser is checked against itself.
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    input_path = os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
+
+    try:
+        candidates = {}
+        for arg in sys.argv[1:]:
+            name, _, spec = arg.partition('=')
+            if name not in REFERENCE_PARSERS:
+                raise ValueError(f"Unknown parser '{name}', expected one of {list(REFERENCE_PARSERS)}")
+            candidates[name] = load_candidate(spec)
+        if not candidates:
+            candidates = {name: reference_parse(name) for name in REFERENCE_PARSERS}
+
+        with open(input_path, 'r', encoding='utf-8') as file:
+            log_content = file.read()
+
+        results = run_harness(candidates, log_content)
+
+        print("\nDifferential Parser Check:")
+        failures = 0
+        for result in results:
+            status = "OK" if result["identical"] else "CRASHED" if result["crashed"] else "DIVERGED"
+            timing = (f"speedup x{result['speedup']} "
+                      f"({result['reference_seconds']}s -> {result['candidate_seconds']}s)"
+                      if result['speedup'] is not None else "")
+            print(f"{result['parser']:<14} {result['case']:<18} {status:<9} {timing}")
+            if not result["identical"]:
+                failures += 1
+                divergence = result["divergence"]
+                print(f"    first divergence at {divergence['path']}")
+                print(f"    expected: {json.dumps(divergence['expected'])[:200]}")
+                print(f"    actual:   {json.dumps(divergence['actual'])[:200]}")
+                event = result["divergent_event"]
+                if event:
+                    print(f"    first divergent event: {event['array']}[{event['index']}]")
+                    print(f"      expected: {json.dumps(event['expected'])[:200]}")
+                    print(f"      actual:   {json.dumps(event['actual'])[:200]}")
+
+        print(f"\n{len(results) - failures}/{len(results)} runs identical")
+        if failures:
+            sys.exit(1)
+
+    except FileNotFoundError:
+        print(f"Error: Could not find input file at {input_path}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: An unexpected error occurred: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,15 @@
 import re
+import sys
 import json
 import os
 from datetime import datetime
 from typing import Dict, List, Optional
-from collections import defaultdict
 
 
 class PlayerAccuracyParser:
-    def __init__(self):
+    def __init__(self, stats_only: bool = False):
+        # In stats-only mode no per-event records are built or returned
+        self.stats_only = stats_only
         self.timestamp_pattern = r'^(\d{2}/\d{2}/\d{2}\d{2} - \d{2}:\d{2}:\d{2})'
         self.damage_pattern = r'"(.+?)<(\d+)>.+?" \[.+?\] attacked "(.+?)<(\d+)>.+?" \[.+?\] with "([^"]+)" \(damage "(\d+)"\).+?\(hitgroup "([^"]+)"\)'
         self.kill_pattern = r'"(.+?)<(\d+)>.+?\] killed "(.+?)<(\d+)>.+?\] with "([^"]+)"(\s*\(headshot\))?'
@@ -23,87 +25,104 @@ class PlayerAccuracyParser:
             "kills": 0,
             "headshot_kills": 0,
             "total_damage": 0,
-            "hitgroups": defaultdict(int),
-            "damage_by_hitgroup": defaultdict(list),
+            "hitgroups": {},
+            "damage_by_hitgroup": {},
             "accuracy_stats": {
-                "hits_by_hitgroup": defaultdict(int),
-                "avg_damage_by_hitgroup": defaultdict(float)
+                "hits_by_hitgroup": {},
+                "avg_damage_by_hitgroup": {}
             }
         }
 
+    def get_weapon_stats(self, state: Dict, player: str, weapon: str) -> Dict:
+        weapons = state["player_stats"].setdefault(player, {})
+        if weapon not in weapons:
+            weapons[weapon] = self.create_weapon_stats_template()
+        return weapons[weapon]
+
     def parse_player_accuracy(self, log_content: str) -> Dict:
-        lines = log_content.strip().split('\n')
-
-        # Initialize tracking variables
-        match_started = False
-        player_stats = defaultdict(lambda: defaultdict(self.create_weapon_stats_template))
-        accuracy_events = []
-
-        for line in lines:
-            # Extract timestamp
-            timestamp_match = re.match(self.timestamp_pattern, line)
-            if not timestamp_match:
-                continue
-
-            timestamp = self.parse_timestamp(timestamp_match.group(1))
-            content = line[timestamp_match.end():].strip(': ')
-
-            # Detect match start
-            if 'World triggered "Match_Start"' in content:
-                match_started = True
-                continue
-
-            # Only process events after match has started
-            if not match_started:
-                continue
-
-            # Parse damage events
-            damage_match = re.search(self.damage_pattern, content)
-            if damage_match:
-                attacker = damage_match.group(1)
-                weapon = damage_match.group(5)
-                damage = int(damage_match.group(6))
-                hitgroup = damage_match.group(7)
-
-                # Update player weapon stats
-                player_stats[attacker][weapon]["hits"] += 1
-                player_stats[attacker][weapon]["total_damage"] += damage
-                player_stats[attacker][weapon]["hitgroups"][hitgroup] += 1
-                player_stats[attacker][weapon]["damage_by_hitgroup"][hitgroup].append(damage)
-
-                # Record event
+        state = self.create_state()
+        for line in log_content.strip().split('\n'):
+            self.process_line(state, line)
+        return self.build_result(state)
+
+    def create_state(self) -> Dict:
+        return {
+            "match_started": False,
+            "player_stats": {},
+            "accuracy_events": []
+        }
+
+    def process_line(self, state: Dict, line: str):
+        # Extract timestamp
+        timestamp_match = re.match(self.timestamp_pattern, line)
+        if not timestamp_match:
+            return
+
+        content = line[timestamp_match.end():].strip(': ')
+
+        # Detect match start
+        if 'World triggered "Match_Start"' in content:
+            state["match_started"] = True
+            return
+
+        # Only process events after match has started
+        if not state["match_started"]:
+            return
+
+        # Parse damage events
+        damage_match = re.search(self.damage_pattern, content)
+        if damage_match:
+            attacker = damage_match.group(1)
+            weapon = damage_match.group(5)
+            damage = int(damage_match.group(6))
+            hitgroup = damage_match.group(7)
+
+            # Update player weapon stats
+            stats = self.get_weapon_stats(state, attacker, weapon)
+            stats["hits"] += 1
+            stats["total_damage"] += damage
+            stats["hitgroups"][hitgroup] = stats["hitgroups"].get(hitgroup, 0) + 1
+            stats["damage_by_hitgroup"][hitgroup] = stats["damage_by_hitgroup"].get(hitgroup, 0) + damage
+
+            # Record event
+            if not self.stats_only:
                 event = {
-                    "timestamp": timestamp.strftime('%H:%M:%S'),
+                    "timestamp": self.parse_timestamp(timestamp_match.group(1)).strftime('%H:%M:%S'),
                     "type": "damage",
                     "player": attacker,
                     "weapon": weapon,
                     "damage": damage,
                     "hitgroup": hitgroup
                 }
-                accuracy_events.append(event)
-                continue
-
-            # Parse kill events
-            kill_match = re.search(self.kill_pattern, content)
-            if kill_match:
-                killer = kill_match.group(1)
-                weapon = kill_match.group(5)
-                is_headshot = bool(kill_match.group(6))
-
-                # Update kill stats
-                player_stats[killer][weapon]["kills"] += 1
-                if is_headshot:
-                    player_stats[killer][weapon]["headshot_kills"] += 1
-
-                # Record event
+                state["accuracy_events"].append(event)
+            return
+
+        # Parse kill events
+        kill_match = re.search(self.kill_pattern, content)
+        if kill_match:
+            killer = kill_match.group(1)
+            weapon = kill_match.group(5)
+            is_headshot = bool(kill_match.group(6))
+
+            # Update kill stats
+            stats = self.get_weapon_stats(state, killer, weapon)
+            stats["kills"] += 1
+            if is_headshot:
+                stats["headshot_kills"] += 1
+
+            # Record event
+            if not self.stats_only:
                 event = {
-                    "timestamp": timestamp.strftime('%H:%M:%S'),
+                    "timestamp": self.parse_timestamp(timestamp_match.group(1)).strftime('%H:%M:%S'),
                     "type": "kill",
                     "player": killer,
                     "weapon": weapon,
                     "headshot": is_headshot
                 }
-                accuracy_events.append(event)
+                state["accuracy_events"].append(event)
+
+    def build_result(self, state: Dict) -> Dict:
+        player_stats = state["player_stats"]
 
         # Calculate final statistics
         formatted_stats = {}
@@ -112,8 +131,8 @@ class PlayerAccuracyParser:
             for weapon, stats in weapons.items():
                 # Calculate averages for each hitgroup
                 hitgroup_averages = {}
-                for hitgroup, damages in stats["damage_by_hitgroup"].items():
-                    hitgroup_averages[hitgroup] = sum(damages) / len(damages)
+                for hitgroup, damage_total in stats["damage_by_hitgroup"].items():
+                    hitgroup_averages[hitgroup] = damage_total / stats["hitgroups"][hitgroup]
 
                 # Calculate headshot percentage
                 hs_percentage = (stats["headshot_kills"] / stats["kills"] * 100) if stats["kills"] > 0 else 0
@@ -135,21 +154,27 @@ class PlayerAccuracyParser:
                     }
                 }
 
-        return {
+        result = {
             "player_stats": formatted_stats,
-            "events": accuracy_events
+            "events": state["accuracy_events"]
         }
+        if self.stats_only:
+            del result["events"]
+        return result
 
 
 def main():
-    parser = PlayerAccuracyParser()
+    # Pass --stats-only to skip per-event records
+    stats_only = '--stats-only' in sys.argv[1:]
+    parser = PlayerAccuracyParser(stats_only=stats_only)
 
     # Get the directory of the script
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
     # Construct paths relative to the script location
     input_path = os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
-    output_path = os.path.join(script_dir, '../../../public/data/player_accuracy_stats.json')
+    output_name = 'player_accuracy_stats_stats_only.json' if stats_only else 'player_accuracy_stats.json'
+    output_path = os.path.join(script_dir, '../../../public/data', output_name)
 
     try:
         # Read input file
@@ -0,0 +1,272 @@
+import re
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class RoundImpactParser:
+    """ADR, KAST and damage per round from a single pass over the log.
+
+    Damage, kills, assists, deaths and trades are accumulated in per-round maps
+    that are folded into the match totals when the next round starts, so the
+    damage and kill streams never have to be joined after the fact.
+    """
+
+    def __init__(self, trade_window_seconds: int = 5):
+        self.trade_window_seconds = trade_window_seconds
+        self.timestamp_pattern = r'^(\d{2}/\d{2}/\d{4} - \d{2}:\d{2}:\d{2})'
+        self.player = r'"([^"]+)<\d+><STEAM_\d:\d:\d+><(CT|TERRORIST)>"'
+        self.kill_pattern = self.player + r' \[[-\d\s]+\] killed ' + self.player + r' \[[-\d\s]+\] with "([^"]+)"'
+        self.damage_pattern = (self.player + r' \[[-\d\s]+\] attacked ' + self.player +
+                               r' \[[-\d\s]+\] with "([^"]+)" \(damage "(\d+)"\).*?\(health "(\d+)"\)')
+        self.assist_pattern = self.player + r' assisted killing ' + self.player
+        self.suicide_pattern = self.player + r' \[[-\d\s]+\] committed suicide with "([^"]+)"'
+        self.switch_pattern = r'"([^"]+)<\d+><STEAM_\d:\d:\d+>" switched from team <[^>]*> to <([^>]*)>'
+        self.disconnect_pattern = self.player + r' disconnected'
+        self.live_pattern = r'\[FACEIT\^\] LIVE!'
+
+    def parse_timestamp(self, timestamp_str: str) -> datetime:
+        return datetime.strptime(timestamp_str, '%m/%d/%Y - %H:%M:%S')
+
+    def initialize_player_stats(self) -> Dict:
+        return {
+            "rounds_played": 0,
+            "total_damage": 0,
+            "kills": 0,
+            "assists": 0,
+            "deaths": 0,
+            "kast_rounds": 0,
+            "trade_kills": 0,
+            "times_traded": 0,
+            "adr": 0,
+            "kast_percentage": 0
+        }
+
+    def initialize_round(self, round_number: int) -> Dict:
+        return {
+            "round_number": round_number,
+            "ended": False,
+            "players": {},
+            "health": {},
+            "damage": {},
+            "kills": {},
+            "assists": {},
+            "dead": set(),
+            "traded": set(),
+            "trade_kills": {},
+            "survivors": None,
+            "recent_deaths": []
+        }
+
+    def update_roster(self, content: str, roster: Dict[str, str], round_data: Dict):
+        """Track every player on a side from any line that tags them, not only combat lines.
+
+        Players seen before Round_End also take part in the current round.
+        """
+        disconnect_match = re.search(self.disconnect_pattern, content)
+        if disconnect_match:
+            roster.pop(disconnect_match.group(1), None)
+            return
+
+        switch_match = re.search(self.switch_pattern, content)
+        if switch_match:
+            player, team = switch_match.groups()
+            if team not in ("CT", "TERRORIST"):
+                roster.pop(player, None)
+                return
+            tagged = [(player, team)]
+        else:
+            tagged = re.findall(self.player, content)
+
+        for player, team in tagged:
+            roster[player] = team
+            if not round_data["ended"]:
+                round_data["players"][player] = team
+
+    def finish_round(self, round_data: Dict, player_stats: Dict) -> Optional[Dict]:
+        """Fold one round's rolling maps into the match totals and return its summary."""
+        if not round_data["ended"]:
+            return None
+
+        players = {}
+        for player in round_data["players"]:
+            kills = round_data["kills"].get(player, 0)
+            assists = round_data["assists"].get(player, 0)
+            damage = round_data["damage"].get(player, 0)
+            died = player in round_data["dead"]
+            survived = player in round_data["survivors"]
+            traded = player in round_data["traded"]
+            kast = kills > 0 or assists > 0 or survived or traded
+
+            players[player] = {
+                "damage": damage,
+                "kills": kills,
+                "assists": assists,
+                "died": died,
+                "survived": survived,
+                "traded": traded,
+                "kast": kast
+            }
+
+            stats = player_stats.setdefault(player, self.initialize_player_stats())
+            stats["rounds_played"] += 1
+            stats["total_damage"] += damage
+            stats["kills"] += kills
+            stats["assists"] += assists
+            stats["deaths"] += int(died)
+            stats["kast_rounds"] += int(kast)
+            stats["times_traded"] += int(traded)
+            stats["trade_kills"] += round_data["trade_kills"].get(player, 0)
+
+        return {"round_number": round_data["round_number"], "players": players}
+
+    def parse_round_impact(self, log_content: str) -> Dict:
+        lines = log_content.strip().split('\n')
+
+        # Initialize tracking variables
+        live_started = False
+        current_round = 0
+        roster = {}
+        player_stats = {}
+        round_history = []
+        round_data = self.initialize_round(0)
+
+        for line in lines:
+            timestamp_match = re.match(self.timestamp_pattern, line)
+            if not timestamp_match:
+                continue
+
+            content = line[timestamp_match.end():].strip(': ')
+            self.update_roster(content, roster, round_data)
+
+            # Rounds are counted as in EnhancedKillParser, from the LIVE! trigger
+            if not live_started:
+                if re.search(self.live_pattern, content):
+                    live_started = True
+                continue
+
+            if 'World triggered "Round_Start"' in content:
+                summary = self.finish_round(round_data, player_stats)
+                if summary:
+                    round_history.append(summary)
+                current_round += 1
+                round_data = self.initialize_round(current_round)
+                round_data["players"] = dict(roster)
+                continue
+
+            if 'World triggered "Round_End"' in content:
+                if not round_data["ended"]:
+                    round_data["ended"] = True
+                    round_data["survivors"] = {p for p in round_data["players"] if p not in round_data["dead"]}
+                continue
+
+            damage_match = re.search(self.damage_pattern, content)
+            if damage_match:
+                attacker, attacker_team, victim, victim_team = damage_match.group(1, 2, 3, 4)
+                damage = int(damage_match.group(6))
+                health_after = int(damage_match.group(7))
+
+                # Only damage up to the victim's remaining health counts
+                health_before = round_data["health"].get(victim, 100)
+                round_data["health"][victim] = health_after
+                if attacker_team != victim_team:
+                    dealt = round_data["damage"]
+                    dealt[attacker] = dealt.get(attacker, 0) + min(damage, health_before)
+                continue
+
+            kill_match = re.search(self.kill_pattern, content)
+            if kill_match:
+                killer, killer_team, victim, victim_team = kill_match.group(1, 2, 3, 4)
+                timestamp = self.parse_timestamp(timestamp_match.group(1))
+
+                round_data["dead"].add(victim)
+                round_data["health"][victim] = 0
+
+                if killer_team != victim_team:
+                    kills = round_data["kills"]
+                    kills[killer] = kills.get(killer, 0) + 1
+
+                    # The victim was the killer of a teammate of ours moments ago
+                    for death_time, dead_player, dead_killer in round_data["recent_deaths"]:
+                        if (dead_killer == victim and round_data["players"].get(dead_player) == killer_team
+                                and (timestamp - death_time).total_seconds() <= self.trade_window_seconds
+                                and dead_player not in round_data["traded"]):
+                            round_data["traded"].add(dead_player)
+                            trade_kills = round_data["trade_kills"]
+                            trade_kills[killer] = trade_kills.get(killer, 0) + 1
+
+                round_data["recent_deaths"].append((timestamp, victim, killer))
+                continue
+
+            # Bomb, fall damage and own grenades kill without a killer
+            suicide_match = re.search(self.suicide_pattern, content)
+            if suicide_match:
+                victim = suicide_match.group(1)
+                round_data["dead"].add(victim)
+                round_data["health"][victim] = 0
+                round_data["recent_deaths"].append((self.parse_timestamp(timestamp_match.group(1)), victim, None))
+                continue
+
+            assist_match = re.search(self.assist_pattern, content)
+            if assist_match:
+                assister, assister_team = assist_match.group(1, 2)
+                if assister_team != assist_match.group(4):
+                    assists = round_data["assists"]
+                    assists[assister] = assists.get(assister, 0) + 1
+
+        summary = self.finish_round(round_data, player_stats)
+        if summary:
+            round_history.append(summary)
+
+        # Calculate final statistics
+        for stats in player_stats.values():
+            rounds_played = stats["rounds_played"]
+            if rounds_played > 0:
+                stats["adr"] = round(stats["total_damage"] / rounds_played, 2)
+                stats["kast_percentage"] = round(stats["kast_rounds"] / rounds_played * 100, 2)
+
+        return {
+            "total_rounds": len(round_history),
+            "player_stats": player_stats,
+            "round_stats": round_history
+        }
+
+
+def main():
+    parser = RoundImpactParser()
+
+    # Get the directory of the script
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # Construct paths relative to the script location
+    input_path = os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
+    output_path = os.path.join(script_dir, '../../../public/data/round_impact_stats.json')
+
+    try:
+        # Read input file
+        with open(input_path, 'r', encoding='utf-8') as file:
+            log_content = file.read()
+
+        # Parse the log
+        impact_data = parser.parse_round_impact(log_content)
+
+        # Write to JSON file
+        with open(output_path, 'w', encoding='utf-8') as file:
+            json.dump(impact_data, file, indent=2)
+
+        # Print summary
+        print("\nRound Impact Analysis:")
+        print(f"Total Rounds: {impact_data['total_rounds']}")
+        for player, stats in impact_data['player_stats'].items():
+            print(f"{player}: ADR {stats['adr']}, KAST {stats['kast_percentage']}%, "
+                  f"K/A/D {stats['kills']}/{stats['assists']}/{stats['deaths']}")
+
+    except FileNotFoundError:
+        print(f"Error: Could not find input file at {input_path}")
+    except Exception as e:
+        print(f"Error: An unexpected error occurred: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
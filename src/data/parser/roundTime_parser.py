@@ -19,46 +19,67 @@ class RoundTimingParser:
         return int(duration)
 
     def parse_round_timings(self, log_content: str) -> Dict:
-        lines = log_content.strip().split('\n')
-
-        # Initialize tracking variables
-        match_started = False
-        rounds_data = []
-        match_start_time = None
-        round_start_time = None
-        actual_rounds = []  # Store all rounds to reindex later
-
-        for line in lines:
-            timestamp_match = re.match(self.timestamp_pattern, line)
-            if not timestamp_match:
-                continue
-
-            timestamp = self.parse_timestamp(timestamp_match.group(1))
-            content = line[timestamp_match.end():].strip(': ')
-
-            # Detect match start
-            if 'World triggered "Match_Start" on "de_nuke"' in content:
-                match_started = True
-                match_start_time = timestamp
-                continue
-
-            # Only process events after match has started
-            if not match_started:
-                continue
-
-            # Detect round start
-            if 'World triggered "Round_Start"' in content:
-                round_start_time = timestamp
-
-            # Detect round end
-            elif ('World triggered "Round_End"' in content or 'World triggered "Game_Over"' in content) and round_start_time:
-                duration = self.calculate_duration(round_start_time, timestamp)
-                actual_rounds.append({
-                    "start_time": round_start_time.strftime('%H:%M:%S'),
-                    "end_time": timestamp.strftime('%H:%M:%S'),
-                    "duration_seconds": duration
-                })
-                round_start_time = None
+        return self.build_result(self.collect_rounds(log_content))
+
+    def collect_rounds(self, log_content: str) -> Dict:
+        """Collect completed rounds, the match start time and the last line's timestamp."""
+        state = self.create_state()
+        for line in log_content.strip().split('\n'):
+            self.process_line(state, line)
+        return state
+
+    def create_state(self) -> Dict:
+        """Timestamps are kept as the raw log strings."""
+        return {
+            "match_started": False,
+            "match_start_time": None,
+            "round_start_time": None,
+            "last_timestamp": None,
+            "actual_rounds": []  # Store all rounds to reindex later
+        }
+
+    def process_line(self, state: Dict, line: str):
+        timestamp_match = re.match(self.timestamp_pattern, line)
+        if not timestamp_match:
+            return
+
+        # The match duration runs to the last timestamped line of the log
+        timestamp = timestamp_match.group(1)
+        state["last_timestamp"] = timestamp
+        content = line[timestamp_match.end():].strip(': ')
+
+        # Detect match start
+        if 'World triggered "Match_Start" on "de_nuke"' in content:
+            state["match_started"] = True
+            state["match_start_time"] = timestamp
+            return
+
+        # Only process events after match has started
+        if not state["match_started"]:
+            return
+
+        # Detect round start
+        if 'World triggered "Round_Start"' in content:
+            state["round_start_time"] = timestamp
+
+        # Detect round end
+        elif ('World triggered "Round_End"' in content or 'World triggered "Game_Over"' in content) and state["round_start_time"]:
+            round_start_time = self.parse_timestamp(state["round_start_time"])
+            round_end_time = self.parse_timestamp(timestamp)
+            state["actual_rounds"].append({
+                "start_time": round_start_time.strftime('%H:%M:%S'),
+                "end_time": round_end_time.strftime('%H:%M:%S'),
+                "duration_seconds": self.calculate_duration(round_start_time, round_end_time)
+            })
+            state["round_start_time"] = None
+
+    def build_result(self, state: Dict) -> Dict:
+        return self.summarize_rounds(state["actual_rounds"], state["match_start_time"], state["last_timestamp"])
+
+    def summarize_rounds(self, actual_rounds: List[Dict], match_start_time: Optional[str],
+                         last_timestamp: Optional[str]) -> Dict:
+        """Number the completed rounds and compute the match timing statistics."""
+        match_start_time = self.parse_timestamp(match_start_time) if match_start_time else None
 
         # Reindex rounds from 1 to match total rounds
         rounds_data = []
@@ -79,7 +100,7 @@ class RoundTimingParser:
                 "match_start_time": match_start_time.strftime('%H:%M:%S') if match_start_time else None,
                 "total_match_duration": self.calculate_duration(
                     match_start_time,
-                    self.parse_timestamp(timestamp_match.group(1))
+                    self.parse_timestamp(last_timestamp)
                 ) if match_start_time else None,
                 "rounds": rounds_data
             }
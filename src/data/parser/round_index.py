@@ -0,0 +1,208 @@
+import re
+import json
+import os
+import sys
+import hashlib
+from typing import Dict, List, Optional
+
+from kills_parser import EnhancedKillParser
+
+
+class RoundIndex:
+    """Byte-offset index of the rounds in a raw server log.
+
+    Built once with a single scan, the index stores where every round starts
+    and ends in the file together with the cumulative state at its start
+    (score and per-player kill counters). parse_round(n) and parse_rounds(a, b)
+    then seek straight to the requested rounds instead of reparsing from line 1.
+
+    Rounds are numbered as in EnhancedKillParser: every Round_Start after the
+    first LIVE! trigger, starting at 1. A round runs until the next Round_Start,
+    so kills logged after Round_End still belong to it.
+    """
+
+    def __init__(self, log_path: str, index_path: Optional[str] = None):
+        self.log_path = log_path
+        self.index_path = index_path or log_path + '.roundidx.json'
+        self.kill_parser = EnhancedKillParser()
+        self.team_score_pattern = r'Team "(CT|TERRORIST)" scored "(\d+)" with "(\d+)" players'
+        self.status_score_pattern = r'MatchStatus: Score: (\d+):(\d+) on map "([^"]+)" RoundsPlayed: (-?\d+)'
+        self.index = None
+
+    def fingerprint(self) -> Dict:
+        """Identify the current file contents cheaply: size, mtime and a hash of the head."""
+        stat = os.stat(self.log_path)
+        with open(self.log_path, 'rb') as file:
+            head_hash = hashlib.sha1(file.read(64 * 1024)).hexdigest()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "head_sha1": head_hash}
+
+    def ensure(self) -> Dict:
+        """Return a valid index, rebuilding it if the log changed since it was built."""
+        fingerprint = self.fingerprint()
+        if self.index is None and os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as file:
+                self.index = json.load(file)
+        if self.index is None or self.index["fingerprint"] != fingerprint:
+            self.index = self.build(fingerprint)
+            self.save()
+        return self.index
+
+    def save(self):
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.index, file)
+        os.replace(temp_path, self.index_path)
+
+    def update_score(self, score: Dict[str, int], content: str):
+        """Track the score the same way MatchStatusParser does."""
+        team_score_match = re.match(self.team_score_pattern, content)
+        if team_score_match:
+            team, team_score, _ = team_score_match.groups()
+            score["CT" if team == "CT" else "T"] = int(team_score)
+            return
+        status_match = re.match(self.status_score_pattern, content)
+        if status_match:
+            score["CT"] = int(status_match.group(1))
+            score["T"] = int(status_match.group(2))
+
+    def build(self, fingerprint: Dict) -> Dict:
+        """Scan the log once, recording round offsets and the state at each boundary."""
+        parser = self.kill_parser
+        live_line = None
+        rounds = []
+        player_stats = {}
+        score = {"CT": 0, "T": 0}
+        offset = 0
+
+        with open(self.log_path, 'rb') as file:
+            for raw_line in file:
+                line_offset = offset
+                offset += len(raw_line)
+                line = raw_line.decode('utf-8').rstrip('\r\n')
+
+                timestamp_match = re.match(parser.timestamp_pattern, line)
+                if not timestamp_match:
+                    continue
+                content = line[timestamp_match.end():].strip(': ')
+
+                self.update_score(score, content.strip())
+
+                if live_line is None:
+                    if re.search(parser.live_pattern, content):
+                        live_line = line
+                    continue
+
+                if re.search(parser.round_start_pattern, content):
+                    if rounds:
+                        rounds[-1]["end_offset"] = line_offset
+                    rounds.append({
+                        "round_number": len(rounds) + 1,
+                        "start_offset": line_offset,
+                        "end_offset": None,
+                        "score_before": dict(score),
+                        "player_stats_before": parser.create_round_snapshot(player_stats)
+                    })
+                    continue
+
+                kill_match = re.search(parser.kill_pattern, content)
+                if not kill_match:
+                    continue
+                killer_name, killer_team = kill_match.group(1), kill_match.group(2)
+                victim_name, victim_team = kill_match.group(4), kill_match.group(5)
+                if killer_name not in player_stats:
+                    player_stats[killer_name] = parser.initialize_player_stats()
+                if victim_name not in player_stats:
+                    player_stats[victim_name] = parser.initialize_player_stats()
+                parser.update_player_stats(player_stats, killer_name, victim_name, kill_match.group(7),
+                                           bool(kill_match.group(8)), killer_team == victim_team)
+
+        if rounds:
+            rounds[-1]["end_offset"] = offset
+
+        return {
+            "fingerprint": fingerprint,
+            "live_line": live_line,
+            "final_score": score,
+            "final_player_stats": player_stats,
+            "rounds": rounds
+        }
+
+    @property
+    def total_rounds(self) -> int:
+        return len(self.ensure()["rounds"])
+
+    def parse_rounds(self, first_round: int, last_round: int) -> Dict:
+        """Parse only rounds first_round..last_round (inclusive) by seeking into the log.
+
+        Kills and round snapshots match what a full parse_kills() reports for
+        those rounds; player_stats are the cumulative totals after last_round.
+        """
+        index = self.ensure()
+        rounds = index["rounds"]
+        if not 1 <= first_round <= last_round <= len(rounds):
+            raise IndexError(f"Round range {first_round}-{last_round} outside 1-{len(rounds)}")
+
+        first = rounds[first_round - 1]
+        last = rounds[last_round - 1]
+        with open(self.log_path, 'rb') as file:
+            file.seek(first["start_offset"])
+            span = file.read(last["end_offset"] - first["start_offset"]).decode('utf-8')
+
+        partial = self.kill_parser.parse_kills(index["live_line"] + '\n' + span)
+
+        base = first["player_stats_before"]
+        round_offset = first_round - 1
+        for kill in partial["kills"]:
+            kill["round"] += round_offset
+        for snapshot in partial["round_stats"]:
+            snapshot["round_number"] += round_offset
+            snapshot["player_stats"] = self.kill_parser.merge_player_stats(base, snapshot["player_stats"])
+
+        player_stats = self.kill_parser.merge_player_stats(base, partial["player_stats"])
+        self.kill_parser.calculate_final_stats(player_stats)
+
+        score_after = rounds[last_round]["score_before"] if last_round < len(rounds) else index["final_score"]
+
+        return {
+            "first_round": first_round,
+            "last_round": last_round,
+            "score_before": first["score_before"],
+            "score_after": score_after,
+            "total_kills": partial["total_kills"],
+            "player_stats": player_stats,
+            "kills": partial["kills"],
+            "round_stats": partial["round_stats"]
+        }
+
+    def parse_round(self, round_number: int) -> Dict:
+        return self.parse_rounds(round_number, round_number)
+
+
+def main():
+    # Usage: python round_index.py [round_number]
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    input_path = os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
+
+    try:
+        round_number = int(sys.argv[1]) if len(sys.argv) > 1 else 17
+
+        index = RoundIndex(input_path)
+        round_data = index.parse_round(round_number)
+
+        print(f"\nRound {round_number} of {index.total_rounds}:")
+        print(f"Score before: {round_data['score_before']['CT']}:{round_data['score_before']['T']}")
+        print(f"Score after: {round_data['score_after']['CT']}:{round_data['score_after']['T']}")
+        print(f"Kills: {round_data['total_kills']}")
+        for kill in round_data['kills']:
+            headshot = " (headshot)" if kill['headshot'] else ""
+            print(f"  {kill['timestamp']} {kill['killer']['name']} killed "
+                  f"{kill['victim']['name']} with {kill['weapon']}{headshot}")
+
+    except FileNotFoundError:
+        print(f"Error: Could not find input file at {input_path}")
+    except Exception as e:
+        print(f"Error: An unexpected error occurred: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
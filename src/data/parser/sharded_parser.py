@@ -0,0 +1,272 @@
+import re
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from kills_parser import EnhancedKillParser
+from roundTime_parser import RoundTimingParser
+from matchSummary_parser import MatchStatusParser
+
+
+def parse_shard(name: str, shard_content: str):
+    """Worker entry point: parse one shard with a fresh parser instance."""
+    if name == "kills":
+        return EnhancedKillParser().parse_kills(shard_content)
+    if name == "round_timings":
+        return RoundTimingParser().collect_rounds(shard_content)["actual_rounds"]
+    return MatchStatusParser().parse_match_status(shard_content)
+
+
+class ShardedMatchParser:
+    """Parse one match in parallel by splitting the log at Round_Start lines.
+
+    A quick serial pass over the marker lines records, for every cut, the
+    state a shard cannot see on its own: whether LIVE! and Match_Start have
+    already happened, and the latest score, team and winner lines that
+    MatchStatusParser would have applied. Each shard is then parsed in a
+    worker process with those lines replayed in front of it, and the partial
+    results are stitched in order. Kill counters are additive, so round
+    snapshots are rebuilt by adding each shard's local counts onto the totals
+    of the shards before it. The stitched output is identical to a serial parse.
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_shard_lines: int = 2000):
+        self.workers = workers or os.cpu_count() or 1
+        self.min_shard_lines = min_shard_lines
+        self.kill_parser = EnhancedKillParser()
+        self.timing_parser = RoundTimingParser()
+        self.status_parser = MatchStatusParser()
+        self.team_score_pattern = r'Team "(CT|TERRORIST)" scored "(\d+)" with "(\d+)" players'
+        self.team_playing_pattern = r'MatchStatus: Team playing "(CT|TERRORIST)": (.+)'
+        self.status_pattern = r'MatchStatus: Score: (\d+):(\d+) on map "([^"]+)" RoundsPlayed: (-?\d+)'
+        self.executor = None
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def status_writer(self, line: str) -> Optional[str]:
+        """Classify a line by the MatchStatusParser state it overwrites, in the parser's order."""
+        timestamp_match = re.match(self.status_parser.timestamp_pattern, line)
+        if not timestamp_match:
+            return None
+        content = line[timestamp_match.end():].strip()
+        if self.status_parser.determine_round_winner(content):
+            return "winner"
+        team_score_match = re.match(self.team_score_pattern, content)
+        if team_score_match:
+            return "score_" + team_score_match.group(1)
+        team_playing_match = re.match(self.team_playing_pattern, content)
+        if team_playing_match:
+            return "team_" + team_playing_match.group(1)
+        if re.match(self.status_pattern, content):
+            return "status"
+        if 'World triggered "Round_End"' in content:
+            return "round_end"
+        return None
+
+    def plan_shards(self, lines: List[str]) -> List[Dict]:
+        """Pick cut points at Round_Start lines and record the context each shard needs."""
+        live_index = None
+        match_start_index = None
+        cut_candidates = []
+        last_writers = {}
+        context_at = {}
+
+        markers = ('World triggered', 'LIVE!', 'SFUI_Notice', 'scored', 'MatchStatus')
+        for i, line in enumerate(lines):
+            if not any(marker in line for marker in markers):
+                continue
+
+            timestamp_match = re.match(self.kill_parser.timestamp_pattern, line)
+            if timestamp_match:
+                content = line[timestamp_match.end():].strip(': ')
+                if content == 'World triggered "Round_Start"':
+                    cut_candidates.append(i)
+                    context_at[i] = dict(last_writers)
+                if live_index is None and re.search(self.kill_parser.live_pattern, content):
+                    live_index = i
+                if match_start_index is None and 'World triggered "Match_Start" on "de_nuke"' in content:
+                    match_start_index = i
+
+            writer = self.status_writer(line)
+            if writer == "round_end":
+                last_writers.pop("winner", None)
+            elif writer:
+                last_writers[writer] = i
+
+        # Spread the cuts so every worker gets a similar number of lines
+        shard_count = min(self.workers, max(1, len(lines) // self.min_shard_lines))
+        cuts = []
+        for k in range(1, shard_count):
+            target = k * len(lines) // shard_count
+            eligible = [c for c in cut_candidates if c > (cuts[-1] if cuts else 0)]
+            if not eligible:
+                break
+            cuts.append(min(eligible, key=lambda c: abs(c - target)))
+        cuts = sorted(set(cuts))
+
+        shards = []
+        for start, end in zip([0] + cuts, cuts + [len(lines)]):
+            writers = context_at.get(start, {})
+            shards.append({
+                "start": start,
+                "end": end,
+                "live_line": lines[live_index] if live_index is not None and live_index < start else None,
+                "match_start_line": (lines[match_start_index]
+                                     if match_start_index is not None and match_start_index < start else None),
+                "status_lines": [lines[i] for i in sorted(writers.values())] if start else []
+            })
+        return shards
+
+    def shard_content(self, name: str, lines: List[str], shard: Dict) -> str:
+        if name == "kills":
+            context = [shard["live_line"]] if shard["live_line"] else []
+        elif name == "round_timings":
+            context = [shard["match_start_line"]] if shard["match_start_line"] else []
+        else:
+            context = shard["status_lines"]
+        return '\n'.join(context + lines[shard["start"]:shard["end"]])
+
+    def run_shards(self, names: List[str], log_content: str) -> Dict[str, Dict]:
+        lines = log_content.strip().split('\n')
+        shards = self.plan_shards(lines)
+
+        tasks = [(name, self.shard_content(name, lines, shard)) for name in names for shard in shards]
+        if len(shards) == 1:
+            results = [parse_shard(name, content) for name, content in tasks]
+        else:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            futures = [self.executor.submit(parse_shard, name, content) for name, content in tasks]
+            results = [future.result() for future in futures]
+
+        partials = {name: results[i * len(shards):(i + 1) * len(shards)] for i, name in enumerate(names)}
+        stitchers = {
+            "kills": self.stitch_kills,
+            "round_timings": self.stitch_round_timings,
+            "match_status": self.stitch_match_status,
+        }
+        return {name: stitchers[name](partials[name], shards, lines) for name in names}
+
+    def stitch_kills(self, partials: List[Dict], shards: List[Dict], lines: List[str]) -> Dict:
+        parser = self.kill_parser
+        player_stats = {}
+        kills = []
+        round_stats = []
+        total_kills = 0
+        round_offset = 0
+        live_start_time = None
+
+        for partial, shard in zip(partials, shards):
+            # A replayed LIVE! line would report the wrong start time
+            if shard["live_line"] is None and partial["live_start_time"]:
+                live_start_time = partial["live_start_time"]
+
+            for kill in partial["kills"]:
+                kill["round"] += round_offset
+            for snapshot in partial["round_stats"]:
+                snapshot["round_number"] += round_offset
+                snapshot["player_stats"] = parser.merge_player_stats(player_stats, snapshot["player_stats"])
+
+            kills.extend(partial["kills"])
+            round_stats.extend(partial["round_stats"])
+            total_kills += partial["total_kills"]
+            round_offset += partial["total_rounds"]
+            player_stats = parser.merge_player_stats(player_stats, partial["player_stats"])
+
+        parser.calculate_final_stats(player_stats)
+
+        return {
+            "live_start_time": live_start_time,
+            "match_start_time": partials[-1]["match_start_time"],
+            "total_kills": total_kills,
+            "total_rounds": round_offset,
+            "player_stats": player_stats,
+            "kills": kills,
+            "round_stats": round_stats
+        }
+
+    def stitch_round_timings(self, partials: List[List[Dict]], shards: List[Dict], lines: List[str]) -> Dict:
+        parser = self.timing_parser
+        actual_rounds = [round_data for partial in partials for round_data in partial]
+
+        # The serial parse keeps the last Match_Start and the last timestamp seen
+        match_start_time = None
+        for line in lines:
+            if 'World triggered "Match_Start" on "de_nuke"' not in line:
+                continue
+            timestamp_match = re.match(parser.timestamp_pattern, line)
+            if timestamp_match and 'World triggered "Match_Start" on "de_nuke"' in line[timestamp_match.end():]:
+                match_start_time = timestamp_match.group(1)
+        last_timestamp = None
+        for line in reversed(lines):
+            last_timestamp_match = re.match(parser.timestamp_pattern, line)
+            if last_timestamp_match:
+                last_timestamp = last_timestamp_match.group(1)
+                break
+
+        return parser.summarize_rounds(actual_rounds, match_start_time, last_timestamp)
+
+    def stitch_match_status(self, partials: List[Dict], shards: List[Dict], lines: List[str]) -> Dict:
+        # Replayed context carries the score and teams forward, so the last
+        # shard already holds the final state
+        result = partials[-1]
+        result["round_history"] = [entry for partial in partials for entry in partial["round_history"]]
+        return result
+
+    def parse_match(self, log_content: str) -> Dict[str, Dict]:
+        return self.run_shards(["kills", "round_timings", "match_status"], log_content)
+
+    def parse_kills(self, log_content: str) -> Dict:
+        return self.run_shards(["kills"], log_content)["kills"]
+
+    def parse_round_timings(self, log_content: str) -> Dict:
+        return self.run_shards(["round_timings"], log_content)["round_timings"]
+
+    def parse_match_status(self, log_content: str) -> Dict:
+        return self.run_shards(["match_status"], log_content)["match_status"]
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    input_path = os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
+
+    parser = ShardedMatchParser()
+    try:
+        with open(input_path, 'r', encoding='utf-8') as file:
+            log_content = file.read()
+
+        shards = parser.plan_shards(log_content.strip().split('\n'))
+
+        start = time.perf_counter()
+        sharded = parser.parse_match(log_content)
+        sharded_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        serial = {
+            "kills": EnhancedKillParser().parse_kills(log_content),
+            "round_timings": RoundTimingParser().parse_round_timings(log_content),
+            "match_status": MatchStatusParser().parse_match_status(log_content)
+        }
+        serial_time = time.perf_counter() - start
+
+        print(f"\nSharded Parse ({len(shards)} shards, {parser.workers} workers):")
+        for name in serial:
+            identical = json.dumps(sharded[name], indent=2) == json.dumps(serial[name], indent=2)
+            print(f"{name}: {'identical' if identical else 'DIFFERS'} to serial parse")
+        print(f"Serial: {serial_time:.3f}s, sharded: {sharded_time:.3f}s")
+
+    except FileNotFoundError:
+        print(f"Error: Could not find input file at {input_path}")
+    except Exception as e:
+        print(f"Error: An unexpected error occurred: {str(e)}")
+    finally:
+        parser.close()
+
+
+if __name__ == "__main__":
+    main()
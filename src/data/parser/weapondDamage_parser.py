@@ -1,13 +1,15 @@
 import re
+import sys
 import json
 import os
 from datetime import datetime
 from typing import Dict, List, Optional
-from collections import defaultdict
 
 
 class WeaponDamageParser:
-    def __init__(self):
+    def __init__(self, stats_only: bool = False):
+        # In stats-only mode no per-hit records are built or returned
+        self.stats_only = stats_only
         self.timestamp_pattern = r'^(\d{2}/\d{2}/\d{2}\d{2} - \d{2}:\d{2}:\d{2})'
         self.damage_pattern = r'"(.+?)<(\d+)>.+?" \[.+?\] attacked "(.+?)<(\d+)>.+?" \[.+?\] with "([^"]+)" \(damage "(\d+)"\).+?\(hitgroup "([^"]+)"\)'
 
@@ -16,69 +18,82 @@ class WeaponDamageParser:
         return datetime.strptime(timestamp_str, '%m/%d/%Y - %H:%M:%S')
 
     def parse_damage_events(self, log_content: str) -> Dict:
-        lines = log_content.strip().split('\n')
+        state = self.create_state()
+        for line in log_content.strip().split('\n'):
+            self.process_line(state, line)
+        return self.build_result(state)
 
-        # Initialize tracking variables
-        match_started = False
-        weapon_stats = defaultdict(lambda: {
+    def create_state(self) -> Dict:
+        return {
+            "match_started": False,
+            "weapon_stats": {},
+            "damage_events": []
+        }
+
+    def create_weapon_stats_template(self) -> Dict:
+        return {
             "total_damage": 0,
             "hits": 0,
-            "hitgroups": defaultdict(int),
+            "hitgroups": {},
             "max_damage": 0,
-            "min_damage": float('inf'),
+            "min_damage": None,
             "avg_damage": 0,
-            "damage_by_hitgroup": defaultdict(list)
-        })
-
-        damage_events = []
+            "damage_by_hitgroup": {}
+        }
 
-        for line in lines:
-            # Extract timestamp
-            timestamp_match = re.match(self.timestamp_pattern, line)
-            if not timestamp_match:
-                continue
+    def process_line(self, state: Dict, line: str):
+        # Extract timestamp
+        timestamp_match = re.match(self.timestamp_pattern, line)
+        if not timestamp_match:
+            return
 
-            timestamp = self.parse_timestamp(timestamp_match.group(1))
-            content = line[timestamp_match.end():].strip(': ')
+        content = line[timestamp_match.end():].strip(': ')
 
-            # Detect match start
-            if 'World triggered "Match_Start"' in content:
-                match_started = True
-                continue
+        # Detect match start
+        if 'World triggered "Match_Start"' in content:
+            state["match_started"] = True
+            return
 
-            # Only process damage after match has started
-            if not match_started:
-                continue
+        # Only process damage after match has started
+        if not state["match_started"]:
+            return
 
-            # Parse damage information
-            damage_match = re.search(self.damage_pattern, content)
-            if not damage_match:
-                continue
+        # Parse damage information
+        damage_match = re.search(self.damage_pattern, content)
+        if not damage_match:
+            return
 
-            attacker = damage_match.group(1)
-            victim = damage_match.group(3)
-            weapon = damage_match.group(5)
-            damage = int(damage_match.group(6))
-            hitgroup = damage_match.group(7)
+        attacker = damage_match.group(1)
+        victim = damage_match.group(3)
+        weapon = damage_match.group(5)
+        damage = int(damage_match.group(6))
+        hitgroup = damage_match.group(7)
 
-            # Record damage event
+        # Record damage event
+        if not self.stats_only:
             event = {
-                "timestamp": timestamp.strftime('%H:%M:%S'),
+                "timestamp": self.parse_timestamp(timestamp_match.group(1)).strftime('%H:%M:%S'),
                 "attacker": attacker,
                 "victim": victim,
                 "weapon": weapon,
                 "damage": damage,
                 "hitgroup": hitgroup
             }
-            damage_events.append(event)
-
-            # Update weapon statistics
-            weapon_stats[weapon]["total_damage"] += damage
-            weapon_stats[weapon]["hits"] += 1
-            weapon_stats[weapon]["hitgroups"][hitgroup] += 1
-            weapon_stats[weapon]["max_damage"] = max(weapon_stats[weapon]["max_damage"], damage)
-            weapon_stats[weapon]["min_damage"] = min(weapon_stats[weapon]["min_damage"], damage)
-            weapon_stats[weapon]["damage_by_hitgroup"][hitgroup].append(damage)
+            state["damage_events"].append(event)
+
+        # Update weapon statistics
+        if weapon not in state["weapon_stats"]:
+            state["weapon_stats"][weapon] = self.create_weapon_stats_template()
+        stats = state["weapon_stats"][weapon]
+        stats["total_damage"] += damage
+        stats["hits"] += 1
+        stats["hitgroups"][hitgroup] = stats["hitgroups"].get(hitgroup, 0) + 1
+        stats["max_damage"] = max(stats["max_damage"], damage)
+        stats["min_damage"] = damage if stats["min_damage"] is None else min(stats["min_damage"], damage)
+        stats["damage_by_hitgroup"][hitgroup] = stats["damage_by_hitgroup"].get(hitgroup, 0) + damage
+
+    def build_result(self, state: Dict) -> Dict:
+        weapon_stats = state["weapon_stats"]
 
         # Calculate averages and format stats
         formatted_stats = {}
@@ -87,34 +102,40 @@ class WeaponDamageParser:
 
             # Calculate average damage per hitgroup
             hitgroup_averages = {}
-            for hitgroup, damages in stats["damage_by_hitgroup"].items():
-                hitgroup_averages[hitgroup] = sum(damages) / len(damages)
+            for hitgroup, damage_total in stats["damage_by_hitgroup"].items():
+                hitgroup_averages[hitgroup] = damage_total / stats["hitgroups"][hitgroup]
 
             formatted_stats[weapon] = {
                 "total_damage": stats["total_damage"],
                 "total_hits": stats["hits"],
                 "max_damage": stats["max_damage"],
-                "min_damage": stats["min_damage"] if stats["min_damage"] != float('inf') else 0,
+                "min_damage": stats["min_damage"] if stats["min_damage"] is not None else 0,
                 "average_damage": round(avg_damage, 2),
                 "hitgroup_distribution": dict(stats["hitgroups"]),
                 "average_damage_by_hitgroup": {k: round(v, 2) for k, v in hitgroup_averages.items()}
             }
 
-        return {
+        result = {
             "weapon_stats": formatted_stats,
-            "damage_events": damage_events
+            "damage_events": state["damage_events"]
         }
+        if self.stats_only:
+            del result["damage_events"]
+        return result
 
 
 def main():
-    parser = WeaponDamageParser()
+    # Pass --stats-only to skip per-hit records
+    stats_only = '--stats-only' in sys.argv[1:]
+    parser = WeaponDamageParser(stats_only=stats_only)
 
     # Get the directory of the script
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
     # Construct paths relative to the script location
     input_path = os.path.join(script_dir, '../NAVIvsVitaGF-Nuke.txt')
-    output_path = os.path.join(script_dir, '../../../public/data/weapon_damage_stats.json')
+    output_name = 'weapon_damage_stats_stats_only.json' if stats_only else 'weapon_damage_stats.json'
+    output_path = os.path.join(script_dir, '../../../public/data', output_name)
 
     try:
         # Read input file